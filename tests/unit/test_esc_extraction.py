@@ -357,6 +357,50 @@ class TestThresholdRegression:
             assert "if best_score >= 10:" not in content, "Old threshold of 10 should not be present"
 
 
+class TestFindEscSheetCache:
+    """Test that sheet search results are remembered per file version."""
+
+    @pytest.fixture
+    def extractor(self, monkeypatch):
+        import sys
+        sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools" / "esc-validator"))
+        from esc_validator import extractor
+
+        calls = []
+
+        def fake_page_labels(pdf_path):
+            calls.append(pdf_path)
+            return 4
+
+        monkeypatch.setattr(extractor, "find_esc_in_page_labels", fake_page_labels)
+        extractor._find_esc_sheet_cached.cache_clear()
+        yield extractor, calls
+        extractor._find_esc_sheet_cached.cache_clear()
+
+    def test_repeat_search_cached(self, extractor, tmp_path):
+        """Searching an unchanged file again doesn't reopen it."""
+        module, calls = extractor
+        pdf_path = tmp_path / "set.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 v1")
+
+        assert module.find_esc_sheet(str(pdf_path)) == 4
+        assert module.find_esc_sheet(str(pdf_path)) == 4
+        assert len(calls) == 1
+
+        pdf_path.write_bytes(b"%PDF-1.4 version 2")
+        assert module.find_esc_sheet(str(pdf_path)) == 4
+        assert len(calls) == 2
+
+    def test_missing_file_not_cached(self, extractor, tmp_path):
+        """Paths that can't be stat'ed are searched (and fail) every time."""
+        module, calls = extractor
+        missing = str(tmp_path / "missing.pdf")
+
+        module.find_esc_sheet(missing)
+        module.find_esc_sheet(missing)
+        assert len(calls) == 2
+
+
 # Parametrized tests for comprehensive coverage
 @pytest.mark.parametrize("text,expected_min_score", [
     # High-value (5 pts)
@@ -10,7 +10,9 @@ Created: 2025-11-02
 Phase: 4.1 (PaddleOCR Integration)
 """
 
+import os
 import sys
+import types
 from pathlib import Path
 import pytest
 import numpy as np
@@ -29,6 +31,7 @@ from esc_validator.ocr_engine import (
     set_ocr_cache,
     get_ocr_cache,
     clear_ocr_cache,
+    single_threaded_tesseract,
 )
 
 
@@ -61,6 +64,70 @@ class TestOCREngineAbstraction:
         engine = get_ocr_engine()  # No argument
         assert engine.get_engine_name() == "PaddleOCR"
 
+    def test_engine_instance_is_reused(self):
+        """Test that repeated calls return the same engine (models load once)."""
+        assert get_ocr_engine("tesseract") is get_ocr_engine("Tesseract")
+
+    def test_concurrent_first_calls_share_engine(self, monkeypatch):
+        """Threads racing to create an engine get one shared instance."""
+        import threading
+        import time
+        import esc_validator.ocr_engine as ocr_engine
+
+        created = []
+
+        class SlowEngine:
+            def __init__(self):
+                created.append(self)
+                time.sleep(0.05)
+
+        monkeypatch.setattr(ocr_engine, "_engine_instances", {})
+        monkeypatch.setattr(ocr_engine, "TesseractOCREngine", SlowEngine)
+        engines = []
+        threads = [
+            threading.Thread(target=lambda: engines.append(get_ocr_engine("tesseract")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(created) == 1
+        assert all(engine is created[0] for engine in engines)
+
+    def test_paddle_hpi_falls_back(self, monkeypatch):
+        """Without the hpi extras, PaddleOCR is created with its defaults."""
+        calls = []
+
+        class FakePaddleOCR:
+            def __init__(self, **kwargs):
+                calls.append(kwargs)
+                if kwargs.get("enable_hpi"):
+                    raise RuntimeError("hpi dependencies missing")
+
+        monkeypatch.setitem(sys.modules, "paddleocr", types.SimpleNamespace(PaddleOCR=FakePaddleOCR))
+        monkeypatch.setenv("ESC_VALIDATOR_PADDLE_HPI", "1")
+        monkeypatch.setenv("ESC_VALIDATOR_PADDLE_PRECISION", "fp16")
+        engine = PaddleOCREngine()
+
+        assert isinstance(engine.ocr, FakePaddleOCR)
+        assert calls == [{"lang": "en", "enable_hpi": True, "precision": "fp16"}, {"lang": "en"}]
+
+    def test_thread_limit_scoped_to_fan_out(self, monkeypatch):
+        """OMP_THREAD_LIMIT is set only inside the block, never overriding the user's."""
+        monkeypatch.delenv("OMP_THREAD_LIMIT", raising=False)
+        with single_threaded_tesseract():
+            with single_threaded_tesseract():
+                assert os.environ["OMP_THREAD_LIMIT"] == "1"
+            assert os.environ["OMP_THREAD_LIMIT"] == "1"
+        assert "OMP_THREAD_LIMIT" not in os.environ
+
+        monkeypatch.setenv("OMP_THREAD_LIMIT", "4")
+        with single_threaded_tesseract():
+            assert os.environ["OMP_THREAD_LIMIT"] == "4"
+        assert os.environ["OMP_THREAD_LIMIT"] == "4"
+
 
 # ============================================================================
 # Test Suite 2: OCRResult Dataclass
@@ -210,6 +277,38 @@ class TestOCRTextExtraction:
         # Should return empty list (no text found)
         assert len(results) == 0
 
+    def test_tesseract_batch_splits_pages(self, monkeypatch):
+        """Batch OCR should map Tesseract page numbers back to input images."""
+        import esc_validator.ocr_engine as ocr_engine
+
+        data = {
+            'page_num': [1, 1, 2, 3],
+            'text': ['SILT', '', 'FENCE', 'SCE'],
+            'conf': [95, -1, 90, 20],
+            'left': [0, 0, 10, 5],
+            'top': [0, 0, 20, 5],
+            'width': [10, 0, 30, 5],
+            'height': [5, 0, 8, 5],
+        }
+        monkeypatch.setattr(ocr_engine, "TESSEROCR_AVAILABLE", False)
+        monkeypatch.setattr(ocr_engine.pytesseract, "image_to_data", lambda *args, **kwargs: data)
+
+        images = [np.zeros((20, 20), dtype=np.uint8) for _ in range(3)]
+        results = TesseractOCREngine().extract_text_batch(images, min_confidence=50)
+
+        assert [[r.text for r in page] for page in results] == [['SILT'], ['FENCE'], []]
+        assert results[1][0].bbox == (10, 20, 40, 28)
+
+    def test_tesseract_batch_malformed_output(self, monkeypatch):
+        """Empty or malformed Tesseract output gives empty results per image."""
+        import esc_validator.ocr_engine as ocr_engine
+
+        monkeypatch.setattr(ocr_engine, "TESSEROCR_AVAILABLE", False)
+        monkeypatch.setattr(ocr_engine.pytesseract, "image_to_data", lambda *args, **kwargs: {})
+
+        images = [np.zeros((20, 20), dtype=np.uint8) for _ in range(2)]
+        assert TesseractOCREngine().extract_text_batch(images) == [[], []]
+
 
 # ============================================================================
 # Test Suite 4: OCR Caching
@@ -465,6 +465,29 @@ class TestQualityChecker:
         # in actual testing without mocking
         pass  # TODO: Add mock tests for full integration
 
+    def test_check_quality_with_ocr_results(self, monkeypatch):
+        """Provided OCR results are used as-is, without running OCR."""
+        from esc_validator import quality_checker
+        from esc_validator.ocr_engine import OCRResult
+
+        def fail(*args, **kwargs):
+            raise AssertionError("OCR should not run")
+
+        monkeypatch.setattr(quality_checker, "get_ocr_engine", fail)
+        monkeypatch.setattr(quality_checker, "get_ocr_cache", fail)
+
+        ocr_results = [
+            OCRResult("SCE", 90.0, (100, 100, 200, 130)),
+            OCRResult("LOC", 90.0, (110, 105, 210, 135)),
+            OCRResult("faint", 10.0, (100, 100, 200, 130)),
+        ]
+        results = QualityChecker().check_quality(
+            np.ones((300, 300), dtype=np.uint8) * 255, ocr_results=ocr_results
+        )
+
+        assert len(results.overlapping_labels) == 1
+        assert {results.overlapping_labels[0].text1, results.overlapping_labels[0].text2} == {"SCE", "LOC"}
+
     def test_quality_check_results_properties(self):
         """Test QualityCheckResults property calculations."""
         from esc_validator.quality_checker import QualityCheckResults
@@ -0,0 +1,64 @@
+"""
+Unit Tests for Report Generation
+
+Tests the markdown and text reports built from validation results.
+"""
+
+import sys
+from pathlib import Path
+import pytest
+
+# Add tools/esc-validator to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools" / "esc-validator"))
+
+from esc_validator.reporter import generate_markdown_report, generate_text_report
+from esc_validator.text_detector import DetectionResult
+
+
+@pytest.fixture
+def results():
+    return {
+        "success": True,
+        "page_num": 0,
+        "detection_results": {
+            "legend": DetectionResult("legend", True, 0.9, 1, ["legend"]),
+        },
+        "quantity_results": {},
+        "summary": {
+            "total": 1, "passed": 1, "failed": 0, "pass_rate": 1.0,
+            "avg_confidence": 0.9, "critical_failures": [],
+        },
+        "sheet_validation": {"is_esc_sheet": False, "confidence": 0.2, "warnings": []},
+        "errors": [],
+    }
+
+
+# ============================================================================
+# Test skipped steps
+# ============================================================================
+
+class TestSkippedSteps:
+    """Test reporting of optional checks skipped on non-ESC sheets."""
+
+    def test_markdown_lists_skipped_steps(self, results):
+        """The markdown report names skipped checks and how to force them."""
+        results["skipped_steps"] = ["line_detection", "quality_checks"]
+        report = generate_markdown_report(results, "sheet.pdf")
+
+        assert "Skipped Checks" in report
+        assert "- Line Type Detection" in report
+        assert "- Quality Checks" in report
+        assert "--force-full-validation" in report
+
+    def test_text_lists_skipped_steps(self, results):
+        """The text report names skipped checks and how to force them."""
+        results["skipped_steps"] = ["line_detection"]
+        report = generate_text_report(results, "sheet.pdf")
+
+        assert "[-] Line Type Detection" in report
+        assert "--force-full-validation" in report
+
+    def test_nothing_skipped(self, results):
+        """Without skipped steps neither report mentions them."""
+        assert "force-full-validation" not in generate_markdown_report(results, "sheet.pdf")
+        assert "force-full-validation" not in generate_text_report(results, "sheet.pdf")
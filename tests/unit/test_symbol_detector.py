@@ -0,0 +1,142 @@
+"""
+Unit Tests for Symbol Detector
+
+Tests contour line classification on synthetic edge images.
+"""
+
+import sys
+import time
+from pathlib import Path
+import numpy as np
+
+# Add tools/esc-validator to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools" / "esc-validator"))
+
+import esc_validator.symbol_detector as symbol_detector
+import esc_validator.text_detector as text_detector
+from esc_validator.symbol_detector import (
+    _classify_lines,
+    classify_line_type,
+    find_labels_near_lines,
+    verify_contour_conventions_smart,
+)
+
+
+def _line_image():
+    """A solid line on row 20 and a dashed line on row 60."""
+    image = np.zeros((100, 400), dtype=np.uint8)
+    image[20, 50:350] = 255
+    # Eight 20 px dashes every 40 px, starting at x=50
+    image[60, 50:370].reshape(8, 40)[:, :20] = 255
+    return image
+
+
+# ============================================================================
+# Test line classification
+# ============================================================================
+
+class TestClassifyLineType:
+    """Test solid/dashed line classification."""
+
+    def test_solid_and_dashed(self):
+        """Continuous lines are solid, broken lines are dashed."""
+        image = _line_image()
+
+        assert classify_line_type(np.array([50, 20, 349, 20]), image) == ("solid", 1.0)
+        line_type, confidence = classify_line_type(np.array([[50, 60, 349, 60]]), image)
+        assert line_type == "dashed"
+        assert confidence > 0.5
+
+    def test_unknown(self):
+        """Blank lines and lines mostly outside the image are unknown."""
+        image = _line_image()
+
+        assert classify_line_type(np.array([50, 90, 349, 90]), image) == ("unknown", 0.0)
+        assert classify_line_type(np.array([380, 20, 2000, 20]), image) == ("unknown", 0.0)
+
+    def test_batch_matches_single(self):
+        """Classifying Hough-shaped [N, 1, 4] lines together matches one at a time."""
+        image = _line_image()
+        lines = np.array([
+            [[50, 20, 349, 20]],
+            [[50, 60, 349, 60]],
+            [[50, 90, 349, 90]],
+            [[-200, 60, 349, 60]],
+        ])
+
+        type_codes, confidences = _classify_lines(lines, image)
+
+        assert list(type_codes) == [1, 2, 0, 2]
+        for line, confidence in zip(lines, confidences):
+            assert classify_line_type(line, image)[1] == confidence
+
+
+# ============================================================================
+# Test label-to-line association
+# ============================================================================
+
+class TestFindLabelsNearLines:
+    """Test matching OCR labels to their closest line."""
+
+    def test_closest_line_within_distance(self):
+        """Each label maps to its nearest line, if close enough."""
+        lines = [
+            np.array([[0, 100, 400, 100]]),  # horizontal
+            np.array([[200, 0, 200, 400]]),  # vertical
+            np.array([[50, 300, 50, 300]]),  # degenerate (a point)
+        ]
+        labels = [("1250", 20, 110), ("1252", 190, 30), ("EX", 53, 304), ("FAR", 390, 390)]
+
+        nearby = find_labels_near_lines(labels, lines, max_distance=20)
+
+        assert nearby == [("1250", 0, 10.0), ("1252", 1, 10.0), ("EX", 2, 5.0)]
+
+    def test_empty_inputs(self):
+        """No labels or no lines, no matches."""
+        assert find_labels_near_lines([], [np.array([[0, 0, 10, 0]])]) == []
+        assert find_labels_near_lines([("1250", 0, 0)], []) == []
+
+
+# ============================================================================
+# Test contour convention verification
+# ============================================================================
+
+class TestVerifyContourConventions:
+    """Test contour line convention checks."""
+
+    def test_fallback_reuses_detected_lines(self, monkeypatch):
+        """The unfiltered fallback doesn't run line detection a second time."""
+        calls = []
+        solid = (np.array([[50, 20, 349, 20]]), 1.0)
+        dashed = (np.array([[50, 60, 349, 60]]), 0.8)
+
+        def fake_detect(image, classify_types=True):
+            calls.append(image)
+            return [solid], [dashed]
+
+        monkeypatch.setattr(symbol_detector, "detect_contour_lines", fake_detect)
+        result = verify_contour_conventions_smart(
+            _line_image(), "existing proposed", use_spatial_filtering=False
+        )
+
+        assert len(calls) == 1
+        assert result["total_lines_detected"] == 2
+        assert result["existing_correct"] and result["proposed_correct"]
+        assert result["existing_confidence"] == 0.8
+
+    def test_label_ocr_joined_without_lines(self, monkeypatch):
+        """Label OCR started alongside line detection never outlives the call."""
+        events = []
+
+        def slow_ocr(image):
+            events.append("start")
+            time.sleep(0.05)
+            events.append("end")
+            return {"text": [], "xy": np.zeros((0, 2), dtype=np.int32)}
+
+        monkeypatch.setattr(text_detector, "extract_text_location_arrays", slow_ocr)
+        monkeypatch.setattr(symbol_detector, "detect_contour_lines", lambda image, classify_types=True: ([], []))
+        result = verify_contour_conventions_smart(_line_image(), "")
+
+        assert result["notes"] == "No lines detected"
+        assert events in ([], ["start", "end"])
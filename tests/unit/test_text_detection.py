@@ -4,6 +4,7 @@ Unit tests for text detection module.
 Tests the text_detector.py module functions in isolation.
 """
 
+import numpy as np
 import pytest
 import sys
 from pathlib import Path
@@ -11,10 +12,31 @@ from pathlib import Path
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import esc_validator.text_detector as text_detector
+from esc_validator.ocr_engine import OCRResult, clear_ocr_cache
 from esc_validator.text_detector import (
     is_contour_label,
     is_existing_contour_label,
     is_proposed_contour_label,
+    fuzzy_match,
+    detect_keyword,
+    count_keyword_occurrences,
+    detect_numeric_labels,
+    extract_text_from_image,
+    clear_ocr_result_cache,
+    clear_visual_result_cache,
+    compute_image_key,
+    extract_ocr_results,
+    set_ocr_disk_cache_dir,
+    detect_required_labels,
+    DetectionResult,
+    verify_minimum_quantities,
+    get_checklist_summary,
+    detect_street_labels_smart,
+    is_likely_notes_section,
+    detect_required_labels_batch,
+    extract_text_with_locations,
+    extract_text_location_arrays,
 )
 
 
@@ -193,6 +215,296 @@ class TestEdgeCases:
         assert not is_contour_label("émoji")
 
 
+# ============================================================================
+# Test keyword matching helpers
+# ============================================================================
+
+class TestKeywordMatching:
+    """Test fuzzy keyword detection and counting."""
+
+    @pytest.mark.parametrize("text,keyword,expected", [
+        ("Install SILT FENCE along LOC", "silt fence", True),   # Exact, case-insensitive
+        ("CONCRETE WASHOTU AREA", "washout", True),             # OCR typo
+        ("PROPOSED GRADING", "legend", False),
+        ("", "legend", False),
+    ])
+    def test_fuzzy_match(self, text, keyword, expected):
+        """Should match exact substrings and near-miss OCR words."""
+        assert fuzzy_match(text, keyword, threshold=0.8) == expected
+
+    def test_detect_keyword_returns_matched_keywords(self):
+        """Should return original-case keywords that matched."""
+        found, matches = detect_keyword("SCE at entrance", ["sce", "rock entrance"])
+        assert found
+        assert matches == ["sce"]
+
+    def test_detect_keyword_exact_only(self):
+        """Should not fuzzy match when fuzzy=False."""
+        found, matches = detect_keyword("WASHOTU", ["washout"], fuzzy=False)
+        assert not found
+        assert matches == []
+
+    def test_count_keyword_occurrences(self):
+        """Should count exact substrings plus fuzzy word matches."""
+        text = "SF SF\nSILT FENCE"
+        # "sf": 2 exact substrings; "silt fence": 1 exact substring
+        assert count_keyword_occurrences(text, ["sf", "silt fence"]) == 3
+
+    def test_count_keyword_occurrences_fuzzy_word(self):
+        """Near-miss OCR words should add to the count."""
+        assert count_keyword_occurrences("WASHOTU", ["washout"], threshold=0.85) == 1
+        assert count_keyword_occurrences("WASHOTU", ["washout"], fuzzy=False) == 0
+
+    def test_count_keyword_occurrences_repeated_fuzzy_words(self):
+        """Each repeat of a near-miss word should be counted."""
+        assert count_keyword_occurrences("WASHOTU WASHOTU\nWASHOTU", ["washout"]) == 3
+
+
+# ============================================================================
+# Test detect_numeric_labels() - Numbers on context lines
+# ============================================================================
+
+class TestDetectNumericLabels:
+    """Test numeric label counting on lines with context keywords."""
+
+    def test_counts_numbers_on_context_lines_only(self):
+        """Numbers on lines without a context keyword should be ignored."""
+        text = "EXISTING 250 252.5\nPROPOSED 260\nLOT 12 BLOCK 3"
+        assert detect_numeric_labels(text, ["existing", "exist", "ex"]) == (True, 2)
+        assert detect_numeric_labels(text, ["lot", "block"]) == (True, 2)
+
+    def test_no_context_match(self):
+        """Should return (False, 0) when no line has a context keyword."""
+        assert detect_numeric_labels("250 252 254", ["proposed"]) == (False, 0)
+
+    def test_empty_keyword_list(self):
+        """An empty keyword list should match nothing."""
+        assert detect_numeric_labels("EXISTING 250", []) == (False, 0)
+
+
+# ============================================================================
+# Test OCR result caching by image content
+# ============================================================================
+
+class _CountingEngine:
+    """Minimal OCR engine stand-in that records how often it runs."""
+
+    def __init__(self):
+        self.calls = 0
+        self.shapes = []
+
+    def extract_text(self, image, lang="eng", min_confidence=0.0):
+        self.calls += 1
+        self.shapes.append(image.shape)
+        return [OCRResult(text="SILT FENCE", confidence=95.0, bbox=(0, 0, 10, 10))]
+
+
+def _sheet(shape=(20, 20)):
+    """Small synthetic sheet: white page with one dark mark, so not blank."""
+    image = np.full(shape, 255, dtype=np.uint8)
+    image[2:6, 2:10] = 0
+    return image
+
+
+class TestOCRResultCache:
+    """Test that identical images are only OCR'd once."""
+
+    @pytest.fixture
+    def engine(self, monkeypatch):
+        engine = _CountingEngine()
+        monkeypatch.setattr(text_detector, "get_ocr_engine", lambda *args, **kwargs: engine)
+        clear_ocr_result_cache()
+        yield engine
+        clear_ocr_result_cache()
+
+    def test_identical_image_hits_cache(self, engine):
+        """Same pixels should reuse the earlier OCR result."""
+        image = _sheet()
+        assert extract_text_from_image(image, use_cache=False) == "SILT FENCE"
+        assert extract_text_from_image(image.copy(), use_cache=False) == "SILT FENCE"
+        assert engine.calls == 1
+
+    def test_different_image_misses_cache(self, engine):
+        """Changed pixels should run OCR again."""
+        image = _sheet()
+        extract_text_from_image(image, use_cache=False)
+        image[10, 10] = 0
+        extract_text_from_image(image, use_cache=False)
+        assert engine.calls == 2
+
+    def test_image_key_skips_hashing(self, engine, monkeypatch):
+        """A precomputed image key is used instead of rehashing the pixels."""
+        image = _sheet()
+        key = compute_image_key(image)
+
+        def fail(image):
+            raise AssertionError("image should not be rehashed")
+
+        monkeypatch.setattr(text_detector, "_image_digest", fail)
+        detect_required_labels(
+            image, checklist_elements=["silt_fence"],
+            enable_visual_detection=False, image_key=key
+        )
+        assert extract_ocr_results(image, ocr_engine="tesseract", image_key=key)[0].text == "SILT FENCE"
+        assert engine.calls == 1
+
+    def test_blank_image_skips_ocr(self, engine):
+        """A featureless page can't contain text; don't run OCR on it."""
+        blank = np.full((20, 20), 255, dtype=np.uint8)
+        assert extract_text_from_image(blank, use_cache=False) == ""
+        assert engine.calls == 0
+
+    def test_downscale_before_ocr(self, engine):
+        """Oversized images are shrunk for OCR; boxes map back to full size."""
+        image = _sheet((100, 40))
+        extract_text_from_image(image, use_cache=False, max_ocr_px=50)
+        results = text_detector._run_ocr_cached(image, "eng", "paddleocr", 0.0, 50)
+
+        assert engine.shapes == [(50, 20)]
+        assert results[0].bbox == (0, 0, 20, 20)
+
+    def test_disk_cache_survives_memory_clear(self, engine, tmp_path):
+        """A fresh process (empty memory cache) should reuse on-disk results."""
+        set_ocr_disk_cache_dir(tmp_path)
+        try:
+            image = _sheet()
+            assert extract_text_from_image(image, use_cache=False) == "SILT FENCE"
+            clear_ocr_result_cache()
+            assert extract_text_from_image(image, use_cache=False) == "SILT FENCE"
+        finally:
+            set_ocr_disk_cache_dir(None)
+
+        assert engine.calls == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_disk_cache_write_failure_is_ignored(self, engine, tmp_path, monkeypatch):
+        """A cache write that can't serialize doesn't fail OCR or leave a temp file."""
+        def fail_dump(*args, **kwargs):
+            raise TypeError("not JSON serializable")
+
+        monkeypatch.setattr(text_detector.json, "dump", fail_dump)
+        set_ocr_disk_cache_dir(tmp_path)
+        try:
+            assert extract_text_from_image(_sheet(), use_cache=False) == "SILT FENCE"
+        finally:
+            set_ocr_disk_cache_dir(None)
+
+        assert list(tmp_path.iterdir()) == []
+
+    def test_batch_detection_inline(self, engine):
+        """Batch detection with one worker should match per-image results."""
+        images = [_sheet(), 255 - _sheet()]
+        results = detect_required_labels_batch(
+            images, checklist_elements=["silt_fence"],
+            enable_visual_detection=False, max_workers=1
+        )
+        assert len(results) == 2
+        assert all(r["silt_fence"].detected for r in results)
+
+    def test_location_arrays_match_dicts(self, engine):
+        """Array layout should carry the same data as the dict layout."""
+        image = _sheet()
+        dicts = extract_text_with_locations(image, use_cached=False)
+        arrays = extract_text_location_arrays(image, use_cached=False)
+        assert arrays['text'] == [d['text'] for d in dicts]
+        assert arrays['xy'].tolist() == [[d['x'], d['y']] for d in dicts]
+        assert arrays['conf'].tolist() == [d['confidence'] for d in dicts]
+        assert engine.calls == 1
+        clear_ocr_cache()
+
+    def test_visual_street_result_reused(self, engine, monkeypatch):
+        """Repeat detection on the same image should not redo visual street checks."""
+        calls = []
+
+        def fake_verify(image, text, visual_count_func=None):
+            calls.append(text)
+            return DetectionResult("streets", True, 0.95, 1, ["Elm St"])
+
+        monkeypatch.setattr(text_detector, "verify_street_labeling_complete", fake_verify)
+        clear_visual_result_cache()
+        image = _sheet()
+        first = detect_required_labels(image, checklist_elements=["streets"])
+        second = detect_required_labels(image.copy(), checklist_elements=["streets"])
+        clear_visual_result_cache()
+
+        assert len(calls) == 1
+        assert first["streets"] == second["streets"]
+
+
+# ============================================================================
+# Test street label detection
+# ============================================================================
+
+class TestStreetLabels:
+    """Test street name detection and notes filtering."""
+
+    def test_detects_title_case_and_all_caps(self):
+        """Should find both label styles, one per line."""
+        text = "Elm Oak Dr\nWILLIAM CANNON DR"
+        detected, count, names = detect_street_labels_smart(text)
+        assert detected
+        assert count == 2
+        assert sorted(names) == ["Elm Oak Dr", "WILLIAM CANNON DR"]
+
+    def test_ignores_notes_lines(self):
+        """Street-like phrases inside notes should not count."""
+        text = "The contractor shall sweep Main Street daily"
+        assert detect_street_labels_smart(text) == (False, 0, [])
+
+    def test_does_not_join_across_lines(self):
+        """ALL CAPS names should not span line breaks."""
+        _, _, names = detect_street_labels_smart("LOT 5\nOAK ST")
+        assert names == ["OAK ST"]
+
+    @pytest.mark.parametrize("line,expected", [
+        ("x" * 101, True),                      # Too long
+        ("all work shall conform", True),       # Mostly lowercase
+        ("SHALL BE REMOVED", True),             # Note words
+        ("WILLIAM CANNON DR", False),
+        ("", False),
+    ])
+    def test_is_likely_notes_section(self, line, expected):
+        """Should classify note-like lines."""
+        assert is_likely_notes_section(line) == expected
+
+
+# ============================================================================
+# Test checklist summary
+# ============================================================================
+
+class TestChecklistSummary:
+    """Test summary statistics and critical failure detection."""
+
+    @pytest.fixture
+    def results(self):
+        return {
+            "legend": DetectionResult("legend", True, 0.9, 1, ["legend"]),
+            "sce": DetectionResult("sce", True, 0.7, 2, ["sce"]),
+            "conc_wash": DetectionResult("conc_wash", False, 0.0, 0, []),
+        }
+
+    def test_summary_counts(self, results):
+        """Passed count and pass rate should reflect detected elements."""
+        summary = get_checklist_summary(results)
+        assert summary["total"] == 3
+        assert summary["passed"] == 2
+        assert summary["failed"] == 1
+        assert summary["pass_rate"] == pytest.approx(2 / 3)
+        assert summary["avg_confidence"] == pytest.approx(0.8)
+
+    def test_critical_failures(self, results):
+        """Elements below minimum quantity should be critical failures."""
+        summary = get_checklist_summary(results)
+        assert summary["critical_failures"] == ["conc_wash"]
+        assert verify_minimum_quantities(results) == {"sce": True, "conc_wash": False}
+
+    def test_missing_critical_element(self):
+        """Critical elements absent from results should fail."""
+        summary = get_checklist_summary({})
+        assert summary["pass_rate"] == 0.0
+        assert sorted(summary["critical_failures"]) == ["conc_wash", "sce"]
+
+
 # ============================================================================
 # Performance Tests
 # ============================================================================
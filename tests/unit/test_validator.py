@@ -0,0 +1,427 @@
+"""
+Unit Tests for ESC Sheet Validator
+
+Tests sheet-type validation and the validation entry points that don't
+need a real drawing set.
+"""
+
+import logging
+import sys
+from pathlib import Path
+import numpy as np
+import pytest
+
+# Add tools/esc-validator to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tools" / "esc-validator"))
+
+import esc_validator.symbol_detector as symbol_detector
+import esc_validator.text_detector as text_detector
+import esc_validator.validator as validator
+from esc_validator.extractor import load_image, save_image
+from esc_validator.ocr_engine import OCRResult, set_ocr_cache
+from esc_validator.validator import (
+    _extract_esc_sheet_cached,
+    _run_quality_checks,
+    set_extraction_cache_dir,
+    validate_esc_sheet,
+    validate_esc_sheets,
+    validate_sheet_type,
+)
+from esc_validator.quality_checker import (
+    OverlapIssue,
+    QualityChecker,
+    QualityCheckResults,
+)
+from esc_validator.text_detector import DetectionResult
+
+
+def _result(element, detected=True, count=1):
+    return DetectionResult(element, detected, 1.0 if detected else 0.0, count, [])
+
+
+# ============================================================================
+# Test sheet type validation
+# ============================================================================
+
+class TestValidateSheetType:
+    """Test ESC sheet-type scoring."""
+
+    def test_esc_features_score(self):
+        """Detected ESC features add their weights."""
+        results = {
+            "silt_fence": _result("silt_fence"),
+            "sce": _result("sce"),
+            "loc": _result("loc"),
+            "legend": _result("legend"),
+        }
+        validation = validate_sheet_type(results)
+
+        assert validation["is_esc_sheet"]
+        assert validation["confidence"] == pytest.approx(0.8)
+        assert validation["warnings"] == []
+
+    def test_no_esc_features(self):
+        """Missing or undetected critical features fail the sheet."""
+        results = {
+            "silt_fence": _result("silt_fence", detected=False, count=0),
+            "loc": _result("loc"),
+        }
+        validation = validate_sheet_type(results)
+
+        assert not validation["is_esc_sheet"]
+        assert validation["confidence"] == 0.0
+        assert "No ESC-specific features" in validation["warnings"][0]
+
+    def test_excessive_counts_penalized(self):
+        """Elements counted more than 50 times look like a cover sheet."""
+        results = {
+            "silt_fence": _result("silt_fence", count=51),
+            "sce": _result("sce", count=50),
+        }
+        validation = validate_sheet_type(results)
+
+        assert validation["confidence"] == pytest.approx(0.4)
+        assert len(validation["warnings"]) == 1
+        assert "silt_fence" in validation["warnings"][0]
+
+
+# ============================================================================
+# Test early exit on non-ESC sheets
+# ============================================================================
+
+class TestNonEscEarlyExit:
+    """Test that optional heavy steps are skipped on non-ESC sheets."""
+
+    @pytest.fixture
+    def blank_sheet_pdf(self, tmp_path, monkeypatch):
+        """A 'PDF' whose extracted sheet is blank, so nothing is detected."""
+        pdf_path = tmp_path / "cover.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+        blank = np.full((40, 40), 255, dtype=np.uint8)
+        monkeypatch.setattr(
+            validator, "extract_esc_sheet",
+            lambda **kwargs: (np.dstack([blank] * 3), blank, 0)
+        )
+        return str(pdf_path)
+
+    def test_optional_steps_skipped(self, blank_sheet_pdf, monkeypatch, caplog):
+        """Line detection isn't run when the sheet isn't an ESC plan, with a warning."""
+        def fail(*args, **kwargs):
+            raise AssertionError("line verification should be skipped")
+
+        monkeypatch.setattr(validator, "_run_line_verification", fail)
+        with caplog.at_level(logging.WARNING, logger=validator.__name__):
+            result = validate_esc_sheet(
+                blank_sheet_pdf, enable_line_detection=True, use_extraction_cache=False
+            )
+
+        assert any("skipping line_detection" in r.getMessage() for r in caplog.records)
+
+        assert result["success"]
+        assert not result["sheet_validation"]["is_esc_sheet"]
+        assert result["skipped_steps"] == ["line_detection"]
+        assert "line_verification" not in result
+
+    def test_force_full_validation(self, blank_sheet_pdf, monkeypatch):
+        """force_full_validation runs the optional steps anyway."""
+        monkeypatch.setattr(
+            validator, "_run_line_verification",
+            lambda *args: ({"contour_lines": []}, [], 0.0)
+        )
+        result = validate_esc_sheet(
+            blank_sheet_pdf, enable_line_detection=True,
+            use_extraction_cache=False, force_full_validation=True
+        )
+
+        assert "skipped_steps" not in result
+        assert result["line_verification"] == {"contour_lines": []}
+
+
+# ============================================================================
+# Test shared OCR cache isolation
+# ============================================================================
+
+class TestOcrCacheIsolation:
+    """Test that one validation never reads another sheet's OCR results."""
+
+    def test_failed_ocr_does_not_reuse_stale_cache(self, tmp_path, monkeypatch):
+        """Step 5 doesn't fall back to OCR results left by an earlier caller."""
+        pdf_path = tmp_path / "sheet.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+        sheet = np.full((40, 40), 128, dtype=np.uint8)
+        monkeypatch.setattr(
+            validator, "extract_esc_sheet",
+            lambda **kwargs: (np.dstack([sheet] * 3), sheet, 0)
+        )
+
+        def failing_ocr(*args, **kwargs):
+            raise RuntimeError("OCR engine crashed")
+
+        monkeypatch.setattr(text_detector, "_run_ocr_cached", failing_ocr)
+        seen_labels = []
+
+        def fake_verify(image, text, **kwargs):
+            seen_labels.extend(text_detector.extract_text_location_arrays(image)["text"])
+            return {"contour_lines": []}
+
+        monkeypatch.setattr(symbol_detector, "verify_contour_conventions_smart", fake_verify)
+        set_ocr_cache([OCRResult("1250", 95.0, (0, 0, 10, 10))])
+        result = validate_esc_sheet(
+            str(pdf_path), enable_line_detection=True, use_extraction_cache=False,
+            force_full_validation=True, ocr_engine="tesseract"
+        )
+
+        assert result["line_verification"] == {"contour_lines": []}
+        assert seen_labels == []
+
+
+# ============================================================================
+# Test quality check results
+# ============================================================================
+
+class TestQualityCheckResults:
+    """Test the JSON-ready quality check summary."""
+
+    @pytest.fixture(autouse=True)
+    def fake_checks(self, monkeypatch):
+        issues = [
+            OverlapIssue("SCE", "LOC", 40, 62.345, "critical", (10, 10)),
+            OverlapIssue("CONC", "WASH", 10, 12.0, "minor", (30, 5)),
+        ]
+        monkeypatch.setattr(
+            QualityChecker, "check_quality",
+            lambda self, image, features=None, ocr_results=None: QualityCheckResults(issues, [])
+        )
+
+    def test_issue_details(self):
+        """Each issue is listed by default."""
+        results, errors, _ = _run_quality_checks(np.zeros((4, 4), dtype=np.uint8))
+
+        overlaps = results["overlapping_labels"]
+        assert results["total_issues"] == 2
+        assert overlaps["critical"] == 1
+        assert [issue["overlap_percent"] for issue in overlaps["issues"]] == [62.3, 12.0]
+        assert "truncated" not in overlaps
+        assert errors == ["WARNING: 1 critical overlapping labels found"]
+
+    def test_counts_only(self):
+        """include_issue_details=False keeps the counts, drops the lists."""
+        results, _, _ = _run_quality_checks(
+            np.zeros((4, 4), dtype=np.uint8), include_issue_details=False
+        )
+
+        overlaps = results["overlapping_labels"]
+        assert results["total_issues"] == 2
+        assert overlaps["total"] == 2 and overlaps["critical"] == 1
+        assert overlaps["issues"] == [] and overlaps["truncated"]
+        assert results["proximity_validation"]["truncated"]
+
+
+# ============================================================================
+# Test image loading
+# ============================================================================
+
+class TestLoadImage:
+    """Test loading saved sheet images."""
+
+    def test_non_ascii_path(self, tmp_path):
+        """Images load from paths cv2.imread can't open on Windows."""
+        image = np.zeros((6, 9, 3), dtype=np.uint8)
+        image[..., 2] = 255
+        path = tmp_path / "plán_éscala.png"
+        assert save_image(image, str(tmp_path / "plain.png"))
+        (tmp_path / "plain.png").rename(path)
+
+        assert np.array_equal(load_image(str(path)), image)
+        assert load_image(str(path), grayscale=True).shape == (6, 9)
+
+    def test_unreadable(self, tmp_path):
+        """Missing, empty and non-image files load as None."""
+        empty = tmp_path / "empty.png"
+        empty.write_bytes(b"")
+        text = tmp_path / "notes.png"
+        text.write_bytes(b"not an image")
+
+        assert load_image(str(tmp_path / "missing.png")) is None
+        assert load_image(str(empty)) is None
+        assert load_image(str(text)) is None
+
+
+# ============================================================================
+# Test batch validation
+# ============================================================================
+
+class TestValidateEscSheets:
+    """Test multi-PDF validation."""
+
+    def test_missing_pdfs_inline(self, tmp_path):
+        """Each PDF gets its own result, in input order."""
+        paths = [str(tmp_path / "a.pdf"), str(tmp_path / "b.pdf")]
+        results = validate_esc_sheets(paths, max_workers=1)
+
+        assert len(results) == 2
+        for path, result in zip(paths, results):
+            assert result == validate_esc_sheet(path)
+            assert not result["success"]
+            assert path in result["errors"][0]
+
+    def test_resume_dir(self, tmp_path, monkeypatch):
+        """Saved results are reused; failures are validated again."""
+        good = tmp_path / "good.pdf"
+        good.write_bytes(b"%PDF-1.4 good")
+        bad = tmp_path / "bad.pdf"
+        bad.write_bytes(b"%PDF-1.4 bad")
+        calls = []
+
+        def fake_validate(pdf_path, **options):
+            calls.append(pdf_path)
+            return {"success": pdf_path == str(good), "errors": [], "dpi": options["dpi"]}
+
+        monkeypatch.setattr(validator, "validate_esc_sheet", fake_validate)
+        paths = [str(good), str(bad)]
+        resume_dir = str(tmp_path / "results")
+
+        first = validate_esc_sheets(paths, max_workers=1, resume_dir=resume_dir)
+        second = validate_esc_sheets(paths, max_workers=1, resume_dir=resume_dir)
+        validate_esc_sheets(paths, dpi=150, max_workers=1, resume_dir=resume_dir)
+
+        assert second == first
+        assert calls == [str(good), str(bad), str(bad), str(good), str(bad)]
+
+    def test_resume_dir_stores_json(self, tmp_path, monkeypatch):
+        """Saved results are plain JSON and come back with DetectionResults rebuilt."""
+        pdf_path = tmp_path / "sheet.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+        saved = {
+            "success": True,
+            "detection_results": {"legend": _result("legend")},
+            "line_verification": {"existing_confidence": np.float64(0.75)},
+            "errors": [],
+        }
+        monkeypatch.setattr(validator, "validate_esc_sheet", lambda pdf_path, **options: saved)
+        resume_dir = tmp_path / "results"
+
+        validate_esc_sheets([str(pdf_path)], max_workers=1, resume_dir=str(resume_dir))
+        monkeypatch.setattr(validator, "validate_esc_sheet", None)
+        [reused] = validate_esc_sheets([str(pdf_path)], max_workers=1, resume_dir=str(resume_dir))
+
+        assert [path.suffix for path in resume_dir.iterdir()] == [".json"]
+        assert reused == saved
+        assert isinstance(reused["detection_results"]["legend"], DetectionResult)
+
+    def test_resume_dir_unserializable_result(self, tmp_path, monkeypatch):
+        """A result that can't be saved leaves no temporary file behind."""
+        pdf_path = tmp_path / "sheet.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+        result = {"success": True, "errors": [], "extra": object()}
+        monkeypatch.setattr(validator, "validate_esc_sheet", lambda pdf_path, **options: result)
+        resume_dir = tmp_path / "results"
+
+        [returned] = validate_esc_sheets([str(pdf_path)], max_workers=1, resume_dir=str(resume_dir))
+
+        assert returned is result
+        assert list(resume_dir.iterdir()) == []
+
+    def test_error_fails_only_that_pdf(self, tmp_path, monkeypatch):
+        """An exception in one PDF doesn't discard the other results."""
+        def fake_validate(pdf_path, **options):
+            if pdf_path.endswith("bad.pdf"):
+                raise MemoryError("sheet too large")
+            return {"success": True, "errors": []}
+
+        monkeypatch.setattr(validator, "validate_esc_sheet", fake_validate)
+        paths = [str(tmp_path / "good.pdf"), str(tmp_path / "bad.pdf"), str(tmp_path / "other.pdf")]
+        results = validate_esc_sheets(paths, max_workers=1)
+
+        assert [result["success"] for result in results] == [True, False, True]
+        assert "sheet too large" in results[1]["errors"][0]
+
+    def test_empty_batch(self):
+        """No PDFs, no results."""
+        assert validate_esc_sheets([]) == []
+
+
+# ============================================================================
+# Test extraction cache
+# ============================================================================
+
+class TestExtractionCache:
+    """Test the on-disk PDF extraction cache."""
+
+    def test_cached_extraction_round_trips(self, tmp_path, monkeypatch):
+        """Second extraction of an unchanged PDF is served from disk."""
+        pdf_path = tmp_path / "sheet.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+
+        original = np.zeros((8, 10, 3), dtype=np.uint8)
+        original[..., 0] = 200  # red channel, catches RGB/BGR swaps
+        preprocessed = np.full((8, 10), 128, dtype=np.uint8)
+        calls = []
+
+        def fake_extract(**kwargs):
+            calls.append(kwargs)
+            return original, preprocessed, 3
+
+        monkeypatch.setattr(validator, "extract_esc_sheet", fake_extract)
+        set_extraction_cache_dir(tmp_path / "cache")
+        try:
+            first = _extract_esc_sheet_cached(pdf_path, "ESC", None, 150)
+            second = _extract_esc_sheet_cached(pdf_path, "ESC", None, 150)
+            _extract_esc_sheet_cached(pdf_path, "ESC", None, 300)
+        finally:
+            set_extraction_cache_dir(None)
+
+        assert len(calls) == 2  # dpi change is a miss
+        assert second[2] == first[2] == 3
+        assert np.array_equal(second[0], original)
+        assert np.array_equal(second[1], preprocessed)
+
+    def test_cached_extraction_without_original(self, tmp_path, monkeypatch):
+        """A hit can skip decoding the full-color sheet."""
+        pdf_path = tmp_path / "sheet.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+        sheet = np.full((8, 10), 128, dtype=np.uint8)
+        monkeypatch.setattr(
+            validator, "extract_esc_sheet",
+            lambda **kwargs: (np.dstack([sheet] * 3), sheet, 0)
+        )
+
+        set_extraction_cache_dir(tmp_path / "cache")
+        try:
+            _extract_esc_sheet_cached(pdf_path, "ESC", None, 150)
+            original, preprocessed, page = _extract_esc_sheet_cached(
+                pdf_path, "ESC", None, 150, load_original=False
+            )
+        finally:
+            set_extraction_cache_dir(None)
+
+        assert original is None
+        assert np.array_equal(preprocessed, sheet)
+        assert page == 0
+
+    def test_original_written_only_when_requested(self, tmp_path, monkeypatch):
+        """A grayscale-only miss skips the full-color PNG; needing it later re-extracts."""
+        pdf_path = tmp_path / "sheet.pdf"
+        pdf_path.write_bytes(b"%PDF-1.4 fake")
+        sheet = np.full((8, 10), 128, dtype=np.uint8)
+        calls = []
+
+        def fake_extract(**kwargs):
+            calls.append(kwargs)
+            return np.dstack([sheet] * 3), sheet, 0
+
+        monkeypatch.setattr(validator, "extract_esc_sheet", fake_extract)
+        cache_dir = tmp_path / "cache"
+        set_extraction_cache_dir(cache_dir)
+        try:
+            _extract_esc_sheet_cached(pdf_path, "ESC", None, 150, load_original=False)
+            assert not list(cache_dir.glob("*_original.png"))
+            _extract_esc_sheet_cached(pdf_path, "ESC", None, 150, load_original=False)
+            original, _, _ = _extract_esc_sheet_cached(pdf_path, "ESC", None, 150)
+            _extract_esc_sheet_cached(pdf_path, "ESC", None, 150)
+        finally:
+            set_extraction_cache_dir(None)
+
+        assert len(calls) == 2
+        assert original.shape == (8, 10, 3)
+        assert len(list(cache_dir.glob("*_original.png"))) == 1
@@ -10,11 +10,13 @@ __author__ = "Christian's Productivity Tools"
 
 from .extractor import extract_esc_sheet
 from .text_detector import detect_required_labels, verify_minimum_quantities
-from .validator import validate_esc_sheet
+from .validator import ValidationResult, validate_esc_sheet, validate_esc_sheets
 
 __all__ = [
     "extract_esc_sheet",
     "detect_required_labels",
     "verify_minimum_quantities",
     "validate_esc_sheet",
+    "validate_esc_sheets",
+    "ValidationResult",
 ]
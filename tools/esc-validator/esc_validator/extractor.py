@@ -6,16 +6,17 @@ images optimized for OCR and computer vision processing.
 """
 
 import logging
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple, Optional
 import pdfplumber
+import pypdfium2 as pdfium
 from PIL import Image, ImageEnhance, ImageFilter
 import cv2
 import numpy as np
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -315,6 +316,31 @@ def find_esc_sheet(pdf_path: str, sheet_keyword: str = "ESC") -> Optional[int]:
     Returns:
         Page number (0-indexed) of best match, or None if no suitable sheet found
     """
+    # The search only depends on the file's contents: remember it per file
+    # version, so extract_esc_sheet() after find_esc_sheet() (or a re-run in
+    # the same session) doesn't rescan every page
+    try:
+        stat = os.stat(pdf_path)
+    except OSError:
+        return _find_esc_sheet(pdf_path, sheet_keyword)
+    return _find_esc_sheet_cached(
+        os.path.abspath(pdf_path), stat.st_mtime_ns, stat.st_size, sheet_keyword
+    )
+
+
+@lru_cache(maxsize=32)
+def _find_esc_sheet_cached(
+    pdf_path: str,
+    mtime_ns: int,
+    size: int,
+    sheet_keyword: str
+) -> Optional[int]:
+    """find_esc_sheet() memoized on path and file version (mtime, size)."""
+    return _find_esc_sheet(pdf_path, sheet_keyword)
+
+
+def _find_esc_sheet(pdf_path: str, sheet_keyword: str) -> Optional[int]:
+    """Uncached find_esc_sheet()."""
     logger.info(f"Searching for ESC sheet in: {pdf_path}")
 
     # PHASE 0: Try PageLabels metadata (Phase 5.1 - instant, most reliable)
@@ -418,20 +444,26 @@ def extract_page_as_image(pdf_path: str, page_num: int, dpi: int = 300) -> Optio
     """
     logger.info(f"Extracting page {page_num + 1} at {dpi} DPI")
 
+    # Render with pdfium directly (what pdfplumber's page.to_image() uses),
+    # straight into an RGB buffer: no pdfminer parse of the page tree and no
+    # BGRX -> PIL -> RGB -> numpy conversions. Same rendering flags as
+    # pdfplumber, so the pixels are identical.
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            if page_num >= len(pdf.pages):
-                logger.error(f"Page {page_num} does not exist (PDF has {len(pdf.pages)} pages)")
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            if page_num >= len(pdf):
+                logger.error(f"Page {page_num} does not exist (PDF has {len(pdf)} pages)")
                 return None
 
-            page = pdf.pages[page_num]
-
-            # Convert page to image at specified DPI
-            img = page.to_image(resolution=dpi)
-
-            # Convert to PIL Image, then to numpy array
-            pil_img = img.original
-            np_img = np.array(pil_img)
+            bitmap = pdf[page_num].render(
+                scale=dpi / 72,
+                no_smoothtext=True,
+                no_smoothpath=True,
+                no_smoothimage=True,
+                rev_byteorder=True
+            )
+            # Copy out of pdfium's buffer before the document is closed
+            np_img = np.array(bitmap.to_numpy())
 
             # Convert RGBA to RGB if needed
             if np_img.shape[2] == 4:
@@ -439,6 +471,8 @@ def extract_page_as_image(pdf_path: str, page_num: int, dpi: int = 300) -> Optio
 
             logger.info(f"Extracted image with shape: {np_img.shape}")
             return np_img
+        finally:
+            pdf.close()
 
     except Exception as e:
         logger.error(f"Error extracting page as image: {e}")
@@ -590,3 +624,32 @@ def save_image(image: np.ndarray, output_path: str) -> bool:
     except Exception as e:
         logger.error(f"Error saving image: {e}")
         return False
+
+
+def load_image(image_path: str, grayscale: bool = False) -> Optional[np.ndarray]:
+    """
+    Load an image saved with save_image().
+
+    Args:
+        image_path: Path to image file
+        grayscale: Load as a single-channel image
+
+    Returns:
+        Image as numpy array (RGB, or grayscale), or None if it can't be read
+    """
+    flags = cv2.IMREAD_GRAYSCALE if grayscale else cv2.IMREAD_COLOR
+    # Decode from a byte buffer rather than cv2.imread(), which can't open
+    # non-ASCII paths on Windows.
+    try:
+        buffer = np.fromfile(image_path, dtype=np.uint8)
+    except (OSError, ValueError):
+        return None
+
+    image = cv2.imdecode(buffer, flags) if buffer.size else None
+    if image is None:
+        return None
+
+    # Convert BGR back to RGB to match extract_page_as_image()
+    if not grayscale:
+        image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    return image
@@ -6,28 +6,100 @@ with automatic fallback and caching support.
 """
 
 import logging
+import os
+import shutil
 import sys
+import tempfile
+import threading
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pytesseract
 
+# Optional: tesserocr keeps Tesseract loaded in-process instead of spawning
+# the tesseract binary (and reloading language data) for every image
+try:
+    import tesserocr
+    TESSEROCR_AVAILABLE = True
+except ImportError:
+    TESSEROCR_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-# Configure Tesseract path for Windows
-if sys.platform == "win32":
-    tesseract_paths = [
-        r"C:\Program Files\Tesseract-OCR\tesseract.exe",
-        r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
-    ]
-    for path in tesseract_paths:
-        if Path(path).exists():
-            pytesseract.pytesseract.tesseract_cmd = path
-            logger.debug(f"Tesseract found at: {path}")
-            break
+# Tesseract's internal OpenMP threading scales poorly when several tesseract
+# processes run at once (see extract_text_from_images); they are set to one
+# thread each only while fanned out. Nesting is counted so overlapping
+# fan-outs don't restore the environment early.
+_omp_limit_lock = threading.Lock()
+_omp_limit_depth = 0
+
+
+@contextmanager
+def single_threaded_tesseract():
+    """
+    Run tesseract processes started inside this block with OMP_THREAD_LIMIT=1.
+
+    An explicit OMP_THREAD_LIMIT from the environment is left untouched.
+
+    Limitations: pytesseract has no per-call environment, so this sets the
+    process-wide os.environ. Any thread that starts tesseract while the block
+    is active inherits the limit too. It also has no effect on an in-process
+    tesserocr backend whose OpenMP runtime is already loaded.
+    """
+    global _omp_limit_depth
+    with _omp_limit_lock:
+        if _omp_limit_depth == 0 and "OMP_THREAD_LIMIT" in os.environ:
+            owned = False
+        else:
+            owned = True
+            _omp_limit_depth += 1
+            os.environ["OMP_THREAD_LIMIT"] = "1"
+    try:
+        yield
+    finally:
+        if owned:
+            with _omp_limit_lock:
+                _omp_limit_depth -= 1
+                if _omp_limit_depth == 0:
+                    os.environ.pop("OMP_THREAD_LIMIT", None)
+
+
+# Default Tesseract install locations on Windows (not usually on PATH)
+_WINDOWS_TESSERACT_PATHS = (
+    r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+    r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
+)
+
+# PaddleOCR 3.x high-performance inference picks the fastest installed backend
+# (OpenVINO / ONNX Runtime / TensorRT) but needs the paddleocr[hpi] extras, so
+# it is opt-in. Read when the PaddleOCR engine is first created.
+PADDLE_HPI_ENV = "ESC_VALIDATOR_PADDLE_HPI"
+PADDLE_PRECISION_ENV = "ESC_VALIDATOR_PADDLE_PRECISION"
+
+
+@lru_cache(maxsize=None)
+def configure_tesseract() -> None:
+    """
+    Point pytesseract at the Tesseract binary, once per process.
+
+    Runs on first engine use rather than at import, so worker processes and
+    CLI commands that never OCR don't pay for the filesystem probes. Call it
+    before using pytesseract directly instead of through an OCR engine.
+    """
+    if shutil.which(pytesseract.pytesseract.tesseract_cmd):
+        return
+
+    if sys.platform == "win32":
+        for path in _WINDOWS_TESSERACT_PATHS:
+            if Path(path).exists():
+                pytesseract.pytesseract.tesseract_cmd = path
+                logger.debug(f"Tesseract found at: {path}")
+                break
 
 
 @dataclass
@@ -103,19 +175,41 @@ class OCREngine(ABC):
 class PaddleOCREngine(OCREngine):
     """PaddleOCR-based engine (primary, fast, accurate)."""
 
-    def __init__(self, lang: str = "en", use_gpu: bool = False):
+    def __init__(
+        self,
+        lang: str = "en",
+        use_gpu: bool = False,
+        enable_hpi: Optional[bool] = None,
+        precision: Optional[str] = None
+    ):
         """
         Initialize PaddleOCR engine.
 
         Args:
             lang: Language code (default: "en")
             use_gpu: Whether to use GPU acceleration (ignored in PaddleOCR 3.x - uses CPU by default)
+            enable_hpi: Use PaddleOCR's high-performance inference backends
+                (default: ESC_VALIDATOR_PADDLE_HPI, off when unset)
+            precision: Inference precision with enable_hpi, "fp32" or "fp16"
+                (default: ESC_VALIDATOR_PADDLE_PRECISION, else "fp32")
         """
+        if enable_hpi is None:
+            enable_hpi = os.environ.get(PADDLE_HPI_ENV, "").lower() in ("1", "true", "yes")
+        if precision is None:
+            precision = os.environ.get(PADDLE_PRECISION_ENV) or "fp32"
+
         try:
             from paddleocr import PaddleOCR
             # Note: PaddleOCR 3.x has different API - simpler initialization
             # GPU support would require different installation (paddlepaddle-gpu)
-            self.ocr = PaddleOCR(lang=lang)
+            self.ocr = None
+            if enable_hpi:
+                try:
+                    self.ocr = PaddleOCR(lang=lang, enable_hpi=True, precision=precision)
+                except Exception as e:
+                    logger.warning(f"PaddleOCR high-performance inference unavailable, using defaults: {e}")
+            if self.ocr is None:
+                self.ocr = PaddleOCR(lang=lang)
             logger.info(f"PaddleOCR engine initialized (lang: {lang})")
         except ImportError as e:
             logger.error(f"PaddleOCR not available: {e}")
@@ -227,7 +321,71 @@ class TesseractOCREngine(OCREngine):
 
     def __init__(self):
         """Initialize Tesseract engine."""
-        logger.info("Tesseract engine initialized")
+        configure_tesseract()
+
+        # One warm tesserocr API per thread and language (PyTessBaseAPI is
+        # not thread-safe, but separate instances can run concurrently)
+        self._local = threading.local()
+        backend = "tesserocr" if TESSEROCR_AVAILABLE else "pytesseract"
+        logger.info(f"Tesseract engine initialized ({backend})")
+
+    def _get_api(self, lang: str):
+        """Return this thread's tesserocr API for lang, creating it on first use."""
+        apis = getattr(self._local, "apis", None)
+        if apis is None:
+            apis = self._local.apis = {}
+
+        api = apis.get(lang)
+        if api is None:
+            # Same settings as the pytesseract path: --psm 6 --oem 3
+            api = tesserocr.PyTessBaseAPI(
+                lang=lang,
+                psm=tesserocr.PSM.SINGLE_BLOCK,
+                oem=tesserocr.OEM.DEFAULT
+            )
+            apis[lang] = api
+        return api
+
+    def _extract_with_tesserocr(
+        self,
+        image: np.ndarray,
+        lang: str,
+        min_confidence: float
+    ) -> List[OCRResult]:
+        """Run OCR in-process with a reused tesserocr API (word level)."""
+        from PIL import Image
+
+        api = self._get_api(lang)
+        api.SetImage(Image.fromarray(image))
+        api.Recognize()
+
+        ocr_results = []
+        level = tesserocr.RIL.WORD
+        iterator = api.GetIterator()
+        if iterator is not None:
+            for word in tesserocr.iterate_level(iterator, level):
+                text = (word.GetUTF8Text(level) or "").strip()
+                confidence = float(word.Confidence(level))
+                bbox = word.BoundingBox(level)
+
+                # Skip empty text and low confidence
+                if not text or bbox is None or confidence < 0:
+                    continue
+
+                if confidence < min_confidence:
+                    continue
+
+                ocr_results.append(OCRResult(
+                    text=text,
+                    confidence=confidence,
+                    bbox=tuple(int(v) for v in bbox)
+                ))
+
+        # Don't let adaptation to this sheet bias the next one
+        api.ClearAdaptiveClassifier()
+        api.Clear()
+
+        return ocr_results
 
     def extract_text(
         self,
@@ -248,6 +406,14 @@ class TesseractOCREngine(OCREngine):
         """
         logger.debug("Running Tesseract text extraction")
 
+        if TESSEROCR_AVAILABLE:
+            try:
+                ocr_results = self._extract_with_tesserocr(image, lang, min_confidence)
+                logger.info(f"Tesseract extracted {len(ocr_results)} text elements")
+                return ocr_results
+            except Exception as e:
+                logger.warning(f"tesserocr failed, falling back to pytesseract: {e}")
+
         try:
             # Configure Tesseract for technical drawings
             custom_config = r'--psm 6 --oem 3'
@@ -260,48 +426,134 @@ class TesseractOCREngine(OCREngine):
                 output_type=pytesseract.Output.DICT
             )
 
-            ocr_results = []
-            for i in range(len(data['text'])):
-                text = data['text'][i].strip()
-                confidence = float(data['conf'][i])
+            _, ocr_results = self._parse_image_data(data, min_confidence)
 
-                # Skip empty text and low confidence
-                if not text or confidence < 0:
-                    continue
+            logger.info(f"Tesseract extracted {len(ocr_results)} text elements")
+            return ocr_results
 
-                if confidence < min_confidence:
-                    continue
+        except Exception as e:
+            logger.error(f"Tesseract error: {e}")
+            return []
 
-                # Extract bounding box (Tesseract format: x, y, w, h)
-                x = int(data['left'][i])
-                y = int(data['top'][i])
-                w = int(data['width'][i])
-                h = int(data['height'][i])
+    @staticmethod
+    def _parse_image_data(
+        data: Dict[str, list],
+        min_confidence: float
+    ) -> Tuple[np.ndarray, List[OCRResult]]:
+        """
+        Convert pytesseract image_to_data output into OCRResult objects.
 
-                # Convert to (x1, y1, x2, y2) format
-                bbox = (x, y, x + w, y + h)
+        Returns:
+            Tuple of (row indices kept, OCRResult objects for those rows)
+        """
+        texts = [t.strip() for t in data['text']]
+        confidences = np.asarray(data['conf'], dtype=np.float64)
+
+        # Skip empty text, Tesseract's -1 (non-word) rows and low confidence
+        keep = np.fromiter((bool(t) for t in texts), dtype=bool, count=len(texts))
+        keep &= ~(confidences < 0) & ~(confidences < min_confidence)
+        indices = np.flatnonzero(keep)
+
+        # Tesseract boxes are (x, y, w, h); convert to (x1, y1, x2, y2)
+        x = np.asarray(data['left'], dtype=np.int64)[indices]
+        y = np.asarray(data['top'], dtype=np.int64)[indices]
+        w = np.asarray(data['width'], dtype=np.int64)[indices]
+        h = np.asarray(data['height'], dtype=np.int64)[indices]
+        bboxes = np.column_stack((x, y, x + w, y + h)).tolist()
+
+        ocr_results = [
+            OCRResult(text=texts[i], confidence=confidence, bbox=tuple(bbox))
+            for i, confidence, bbox in zip(
+                indices.tolist(), confidences[indices].tolist(), bboxes
+            )
+        ]
+        return indices, ocr_results
 
-                ocr_results.append(OCRResult(
-                    text=text,
-                    confidence=confidence,
-                    bbox=bbox
-                ))
+    def extract_text_batch(
+        self,
+        images: List[np.ndarray],
+        lang: str = "eng",
+        min_confidence: float = 0.0
+    ) -> List[List[OCRResult]]:
+        """
+        Extract text from several images in one Tesseract run.
 
-            logger.info(f"Tesseract extracted {len(ocr_results)} text elements")
-            return ocr_results
+        Without tesserocr, every extract_text() call starts a tesseract
+        process and reloads the language data. Here the images are written
+        to a temporary directory and passed to a single tesseract process as
+        a file list, with results split back per image by page number.
 
+        Args:
+            images: Preprocessed images as numpy arrays (grayscale)
+            lang: Tesseract language (default: "eng")
+            min_confidence: Minimum confidence threshold (0-100)
+
+        Returns:
+            List of OCRResult lists, one per input image
+        """
+        # tesserocr is already in-process; nothing to amortize
+        if TESSEROCR_AVAILABLE or len(images) < 2:
+            return [self.extract_text(image, lang, min_confidence) for image in images]
+
+        from PIL import Image
+
+        try:
+            with tempfile.TemporaryDirectory(prefix="esc_ocr_") as tmp_dir:
+                paths = []
+                for i, image in enumerate(images):
+                    path = os.path.join(tmp_dir, f"page_{i:04d}.png")
+                    Image.fromarray(image).save(path)
+                    paths.append(path)
+
+                file_list = os.path.join(tmp_dir, "images.txt")
+                with open(file_list, "w", encoding="utf-8") as f:
+                    f.write("\n".join(paths) + "\n")
+
+                data = pytesseract.image_to_data(
+                    file_list,
+                    lang=lang,
+                    config=r'--psm 6 --oem 3',
+                    output_type=pytesseract.Output.DICT
+                )
+        except Exception as e:
+            logger.warning(f"Batch Tesseract run failed, falling back to per-image OCR: {e}")
+            return [self.extract_text(image, lang, min_confidence) for image in images]
+
+        batch_results: List[List[OCRResult]] = [[] for _ in images]
+        try:
+            indices, ocr_results = self._parse_image_data(data, min_confidence)
+
+            # page_num is 1-based, one page per listed image
+            pages = np.asarray(data['page_num'], dtype=np.int64)[indices].tolist()
+            for page, result in zip(pages, ocr_results):
+                batch_results[page - 1].append(result)
         except Exception as e:
+            # Empty or malformed TSV: no results, as extract_text() would give
             logger.error(f"Tesseract error: {e}")
-            return []
+            return [[] for _ in images]
+
+        logger.info(f"Tesseract extracted {len(ocr_results)} text elements from {len(images)} images")
+        return batch_results
 
     def get_engine_name(self) -> str:
         return "Tesseract"
 
 
+# Engine instances keyed by (engine name, use_gpu). Constructing PaddleOCR
+# loads its detection/recognition models, so reuse one instance per process
+# instead of reloading the models for every image.
+_engine_instances: Dict[Tuple[str, bool], OCREngine] = {}
+# Serializes engine creation, so concurrent first calls (e.g. validator's
+# warm-up thread and the main thread) share one instance
+_engine_lock = threading.Lock()
+
+
 def get_ocr_engine(engine: str = "paddleocr", use_gpu: bool = False) -> OCREngine:
     """
     Factory function to create OCR engine.
 
+    Engines are created once per process and reused on subsequent calls.
+
     Args:
         engine: Engine name ("paddleocr" or "tesseract")
         use_gpu: Whether to use GPU (PaddleOCR only)
@@ -314,19 +566,33 @@ def get_ocr_engine(engine: str = "paddleocr", use_gpu: bool = False) -> OCREngin
         RuntimeError: If requested engine is not available
     """
     engine_lower = engine.lower()
+    key = (engine_lower, use_gpu)
 
-    if engine_lower == "paddleocr":
-        try:
-            return PaddleOCREngine(use_gpu=use_gpu)
-        except RuntimeError as e:
-            logger.warning(f"PaddleOCR not available, falling back to Tesseract: {e}")
-            return TesseractOCREngine()
+    cached = _engine_instances.get(key)
+    if cached is not None:
+        return cached
+
+    with _engine_lock:
+        # Another thread may have created it while this one waited
+        cached = _engine_instances.get(key)
+        if cached is not None:
+            return cached
+
+        if engine_lower == "paddleocr":
+            try:
+                instance = PaddleOCREngine(use_gpu=use_gpu)
+            except RuntimeError as e:
+                logger.warning(f"PaddleOCR not available, falling back to Tesseract: {e}")
+                instance = TesseractOCREngine()
+
+        elif engine_lower == "tesseract":
+            instance = TesseractOCREngine()
 
-    elif engine_lower == "tesseract":
-        return TesseractOCREngine()
+        else:
+            raise ValueError(f"Unknown OCR engine: {engine}. Choose 'paddleocr' or 'tesseract'")
 
-    else:
-        raise ValueError(f"Unknown OCR engine: {engine}. Choose 'paddleocr' or 'tesseract'")
+        _engine_instances[key] = instance
+        return instance
 
 
 # Global OCR cache for Phase 1 → Phase 4 sharing
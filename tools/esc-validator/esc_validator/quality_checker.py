@@ -129,7 +129,8 @@ def extract_text_with_bboxes(
     lang: str = "eng",
     min_confidence: float = 0.0,
     ocr_engine: str = "paddleocr",
-    use_cached: bool = True
+    use_cached: bool = True,
+    ocr_results: Optional[List[OCRResult]] = None
 ) -> List[TextElement]:
     """
     Extract text with full bounding boxes from image (Phase 4.1 Enhanced).
@@ -142,13 +143,16 @@ def extract_text_with_bboxes(
         min_confidence: Minimum confidence threshold (0-100), default 0
         ocr_engine: OCR engine to use if cache miss (default: "paddleocr")
         use_cached: Whether to use cached results (default: True)
+        ocr_results: OCR results already computed for this image; skips both
+                     the cache and OCR (default: None)
 
     Returns:
         List of TextElement objects with bounding boxes
     """
-    # Try to use cached results first (Phase 4.1 performance optimization)
-    ocr_results = None
-    if use_cached:
+    # Prefer results handed in, then cached results (Phase 4.1 performance optimization)
+    if ocr_results is not None:
+        logger.debug(f"Using provided OCR results ({len(ocr_results)} elements)")
+    elif use_cached:
         ocr_results = get_ocr_cache()
         if ocr_results:
             logger.info(f"Using cached OCR results ({len(ocr_results)} elements) - SKIPPING redundant OCR")
@@ -504,7 +508,8 @@ class QualityChecker:
     def check_quality(
         self,
         image: np.ndarray,
-        features: Dict[str, List[Tuple[float, float]]] = None
+        features: Dict[str, List[Tuple[float, float]]] = None,
+        ocr_results: Optional[List[OCRResult]] = None
     ) -> QualityCheckResults:
         """
         Run all quality checks on an image.
@@ -512,6 +517,8 @@ class QualityChecker:
         Args:
             image: Preprocessed image as numpy array
             features: Optional dict of feature locations for proximity validation
+            ocr_results: OCR results already computed for this image, e.g. by
+                         text detection (default: None, use the shared OCR cache)
 
         Returns:
             QualityCheckResults with all detected issues
@@ -521,7 +528,8 @@ class QualityChecker:
         # Extract text with bounding boxes
         text_elements = extract_text_with_bboxes(
             image,
-            min_confidence=self.min_text_confidence
+            min_confidence=self.min_text_confidence,
+            ocr_results=ocr_results
         )
 
         if not text_elements:
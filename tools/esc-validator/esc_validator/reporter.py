@@ -11,8 +11,6 @@ from pathlib import Path
 
 from .text_detector import DetectionResult
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +30,16 @@ ELEMENT_DISPLAY_NAMES = {
     "lot_block": "Lot and Block Labels",
 }
 
+# Optional validation steps, as named in validate_esc_sheet()'s skipped_steps
+STEP_DISPLAY_NAMES = {
+    "line_detection": "Line Type Detection",
+    "quality_checks": "Quality Checks",
+}
+
+_FORCE_FULL_VALIDATION_HINT = (
+    "Re-run with --force-full-validation (force_full_validation=True) to run them anyway."
+)
+
 
 def format_status_icon(detected: bool) -> str:
     """Format pass/fail as icon."""
@@ -69,6 +77,7 @@ def generate_markdown_report(
     summary = validation_results["summary"]
     sheet_validation = validation_results.get("sheet_validation", {})
     errors = validation_results.get("errors", [])
+    skipped_steps = validation_results.get("skipped_steps", [])
 
     # Build report
     lines = []
@@ -96,6 +105,18 @@ def generate_markdown_report(
         lines.append("**Recommendation:** Verify this is the correct ESC sheet before relying on results.")
         lines.append("")
 
+    # Optional checks skipped because the sheet doesn't look like an ESC sheet
+    if skipped_steps:
+        lines.append("## ⏭️ Skipped Checks")
+        lines.append("")
+        lines.append("These checks were not run because this does not appear to be an ESC sheet:")
+        lines.append("")
+        for step in skipped_steps:
+            lines.append(f"- {STEP_DISPLAY_NAMES.get(step, step)}")
+        lines.append("")
+        lines.append(_FORCE_FULL_VALIDATION_HINT)
+        lines.append("")
+
     # Overall status
     if not success:
         lines.append("## ⚠️ VALIDATION FAILED")
@@ -262,6 +283,7 @@ def generate_text_report(
     detection_results = validation_results["detection_results"]
     summary = validation_results["summary"]
     critical_failures = summary.get("critical_failures", [])
+    skipped_steps = validation_results.get("skipped_steps", [])
 
     lines = []
     lines.append("=" * 60)
@@ -287,6 +309,14 @@ def generate_text_report(
             lines.append(f"  [!] {display_name}")
         lines.append("")
 
+    # Skipped optional checks
+    if skipped_steps:
+        lines.append("SKIPPED (not an ESC sheet):")
+        for step in skipped_steps:
+            lines.append(f"  [-] {STEP_DISPLAY_NAMES.get(step, step)}")
+        lines.append(f"  {_FORCE_FULL_VALIDATION_HINT}")
+        lines.append("")
+
     # Checklist
     lines.append("CHECKLIST:")
     for element, result in detection_results.items():
@@ -7,10 +7,13 @@ Uses ORB (Oriented FAST and Rotated BRIEF) for rotation-invariant feature matchi
 
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Tuple, Optional, Dict
 import logging
 
+from .ocr_engine import configure_tesseract
+
 logger = logging.getLogger(__name__)
 
 
@@ -351,6 +354,33 @@ def point_to_line_distance(point: Tuple[float, float], line_p1: Tuple[float, flo
     return numerator / denominator
 
 
+def _points_to_line_distance(
+    points: np.ndarray,
+    line_p1: Tuple[float, float],
+    line_p2: Tuple[float, float]
+) -> np.ndarray:
+    """Vectorized point_to_line_distance() for an [N, 2] array of points."""
+    px, py = points[:, 0], points[:, 1]
+    x1, y1 = line_p1
+    x2, y2 = line_p2
+
+    a = y2 - y1
+    b = -(x2 - x1)
+    c = x2*y1 - y2*x1
+    denominator = np.sqrt(a*a + b*b)
+
+    if denominator == 0:
+        # Degenerate line (point)
+        return np.sqrt((px-x1)**2 + (py-y1)**2)
+
+    return np.abs(a*px + b*py + c) / denominator
+
+
+def _line_angles(coords: np.ndarray) -> np.ndarray:
+    """Angle in degrees of each [x1, y1, x2, y2] row."""
+    return np.arctan2(coords[:, 3] - coords[:, 1], coords[:, 2] - coords[:, 0]) * 180 / np.pi
+
+
 def group_parallel_lines(lines: np.ndarray, angle_threshold: float = 15, distance_threshold: float = 100) -> list:
     """
     Group parallel lines that likely form streets.
@@ -371,42 +401,38 @@ def group_parallel_lines(lines: np.ndarray, angle_threshold: float = 15, distanc
     if lines is None or len(lines) == 0:
         return []
 
+    # Angles and midpoints of all lines up front
+    coords = np.asarray(lines).reshape(-1, 4)
+    angles = _line_angles(coords)
+    midpoints = (coords[:, :2] + coords[:, 2:]) / 2
+
     street_groups = []
-    used = set()
+    used = np.zeros(len(coords), dtype=bool)
 
-    for i, line1 in enumerate(lines):
-        if i in used:
+    for i in range(len(coords)):
+        if used[i]:
             continue
 
-        x1, y1, x2, y2 = line1[0]
-        angle1 = np.arctan2(y2-y1, x2-x1) * 180 / np.pi
+        x1, y1, x2, y2 = coords[i]
 
         # Start new street group
-        group = [line1]
-        used.add(i)
+        used[i] = True
 
-        # Find parallel lines nearby (road edges)
-        for j, line2 in enumerate(lines):
-            if j in used or j <= i:
-                continue
+        # Find parallel lines nearby (road edges) among the later unused lines
+        candidates = ~used
+        candidates[:i] = False
 
-            x3, y3, x4, y4 = line2[0]
-            angle2 = np.arctan2(y4-y3, x4-x3) * 180 / np.pi
+        # Check if parallel (accounting for 180° wrapping)
+        angle_diff = np.abs(angles[i] - angles)
+        angle_diff = np.where(angle_diff > 180, 360 - angle_diff, angle_diff)
+        parallel = (angle_diff <= angle_threshold) | (angle_diff >= 180 - angle_threshold)
 
-            # Check if parallel (accounting for 180° wrapping)
-            angle_diff = abs(angle1 - angle2)
-            if angle_diff > 180:
-                angle_diff = 360 - angle_diff
-            if angle_diff > angle_threshold and angle_diff < (180 - angle_threshold):
-                continue
+        # Check if nearby (within road width)
+        dist = _points_to_line_distance(midpoints, (x1, y1), (x2, y2))
 
-            # Check if nearby (within road width)
-            midpoint = ((x3+x4)/2, (y3+y4)/2)
-            dist = point_to_line_distance(midpoint, (x1, y1), (x2, y2))
-
-            if dist < distance_threshold:
-                group.append(line2)
-                used.add(j)
+        members = np.flatnonzero(candidates & parallel & (dist < distance_threshold))
+        used[members] = True
+        group = [lines[i]] + [lines[j] for j in members]
 
         # Only count as street if has parallel lines OR very long (major road)
         line_len = np.sqrt((x2-x1)**2 + (y2-y1)**2)
@@ -417,10 +443,75 @@ def group_parallel_lines(lines: np.ndarray, angle_threshold: float = 15, distanc
     return street_groups
 
 
+# Line type codes returned by _classify_lines()
+_LINE_TYPES = ("unknown", "solid", "dashed")
+
+
+def _classify_lines(
+    lines: np.ndarray,
+    image: np.ndarray,
+    sample_points: int = 20
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Classify many lines at once (see classify_line_type for the rules).
+
+    All lines are sampled with one (N, sample_points) gather instead of a
+    Python call per Hough segment.
+
+    Args:
+        lines: Line coordinates, shape [N, 4] or [N, 1, 4]
+        image: Binary edge image
+        sample_points: Number of points to sample along each line
+
+    Returns:
+        Tuple of (type_codes, confidences), both shape [N]; codes index
+        into _LINE_TYPES
+    """
+    coords = np.asarray(lines).reshape(-1, 4).astype(np.float64)
+    x1, y1, x2, y2 = (coords[:, i:i + 1] for i in range(4))
+
+    # Sample points along every line
+    t = np.linspace(0, 1, sample_points)
+    x_points = (x1 + t * (x2 - x1)).astype(int)
+    y_points = (y1 + t * (y2 - y1)).astype(int)
+
+    # Points outside the image are dropped; along a straight line the points
+    # inside form one contiguous run
+    h, w = image.shape[:2]
+    valid = (x_points >= 0) & (x_points < w) & (y_points >= 0) & (y_points < h)
+    num_valid = valid.sum(axis=1)
+    intensities = image[np.where(valid, y_points, 0), np.where(valid, x_points, 0)]
+
+    # Gaps are intensities below 0.5, after scaling 0-255 profiles to 0-1
+    row_max = np.where(valid, intensities, 0).max(axis=1)
+    scale = np.where(row_max > 1, 255.0, 1.0)
+    gaps = intensities < (0.5 * scale)[:, None]
+
+    # Transitions between line and gap, counted between valid neighbours
+    num_transitions = ((gaps[:, 1:] != gaps[:, :-1]) & valid[:, 1:] & valid[:, :-1]).sum(axis=1)
+    coverage = (valid & ~gaps).sum(axis=1) / np.maximum(num_valid, 1)
+
+    enough = num_valid >= 5
+    solid = enough & (coverage > 0.8) & (num_transitions < 4)
+    dashed = enough & ~solid & (coverage >= 0.3) & (num_transitions >= 4)
+
+    type_codes = np.where(solid, 1, np.where(dashed, 2, 0))
+    confidences = np.where(
+        solid, np.minimum(1.0, coverage),
+        np.where(dashed, np.minimum(1.0, num_transitions / 10.0), 0.0)
+    )
+    return type_codes, confidences
+
+
 def classify_line_type(line: np.ndarray, image: np.ndarray, sample_points: int = 20) -> Tuple[str, float]:
     """
     Classify a line as solid or dashed by analyzing pixel intensities along the line.
 
+    Classification logic:
+    - Solid line: high coverage (>80%), few transitions (<4)
+    - Dashed line: moderate coverage (30-80%), many transitions (>=4)
+    - Unknown: very low coverage (<30%) or fewer than 5 samples in the image
+
     Args:
         line: Line coordinates [x1, y1, x2, y2]
         image: Binary edge image
@@ -431,59 +522,16 @@ def classify_line_type(line: np.ndarray, image: np.ndarray, sample_points: int =
         - line_type: "solid", "dashed", or "unknown"
         - confidence: 0.0-1.0 confidence score
     """
-    x1, y1, x2, y2 = line[0] if len(line.shape) == 2 else line
+    type_codes, confidences = _classify_lines(line, image, sample_points)
+    line_type = _LINE_TYPES[type_codes[0]]
 
-    # Generate sample points along the line
-    t = np.linspace(0, 1, sample_points)
-    x_points = (x1 + t * (x2 - x1)).astype(int)
-    y_points = (y1 + t * (y2 - y1)).astype(int)
+    logger.debug(f"Line classification: {line_type} (confidence={confidences[0]:.2f})")
 
-    # Clip to image bounds
-    h, w = image.shape[:2]
-    valid_mask = (x_points >= 0) & (x_points < w) & (y_points >= 0) & (y_points < h)
-    x_points = x_points[valid_mask]
-    y_points = y_points[valid_mask]
-
-    if len(x_points) < 5:
-        return "unknown", 0.0
-
-    # Sample pixel intensities along the line
-    intensities = image[y_points, x_points]
-
-    # Normalize to 0-1 range
-    if intensities.max() > 1:
-        intensities = intensities / 255.0
-
-    # Detect gaps (low intensity = no line)
-    threshold = 0.5
-    gaps = intensities < threshold
-
-    # Count transitions between line and gap
-    transitions = np.diff(gaps.astype(int))
-    num_transitions = np.sum(np.abs(transitions))
-
-    # Calculate line coverage (what % of the line has pixels)
-    coverage = np.sum(~gaps) / len(gaps)
-
-    # Classification logic:
-    # Solid line: high coverage (>80%), few transitions (<4)
-    # Dashed line: moderate coverage (30-80%), many transitions (≥4)
-    # Unknown: very low coverage (<30%)
-
-    if coverage > 0.8 and num_transitions < 4:
-        line_type = "solid"
-        confidence = min(1.0, coverage)
-    elif coverage >= 0.3 and num_transitions >= 4:
-        line_type = "dashed"
-        # More transitions = higher confidence it's dashed
-        confidence = min(1.0, num_transitions / 10.0)
-    else:
-        line_type = "unknown"
-        confidence = 0.0
+    return line_type, float(confidences[0])
 
-    logger.debug(f"Line classification: {line_type} (coverage={coverage:.2f}, transitions={num_transitions})")
 
-    return line_type, confidence
+# Hough accumulator votes (edge pixels) needed for a contour line
+_CONTOUR_HOUGH_THRESHOLD = 80
 
 
 def detect_contour_lines(
@@ -505,21 +553,29 @@ def detect_contour_lines(
         Tuple of (solid_lines, dashed_lines)
         Each is a list of tuples: [(line_coords, confidence), ...]
     """
-    # Convert to grayscale if needed
+    # Convert to grayscale if needed (Canny doesn't modify its input, so a
+    # grayscale sheet is used as-is instead of copying the whole page)
     if len(image.shape) == 3:
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     else:
-        gray = image.copy()
+        gray = image
 
     # Edge detection
     edges = cv2.Canny(gray, 50, 150, apertureSize=3)
+    del gray
+
+    # Every Hough line needs at least threshold edge pixels, so a (nearly)
+    # blank sheet can't produce any; skip the transform
+    if cv2.countNonZero(edges) < _CONTOUR_HOUGH_THRESHOLD:
+        logger.debug("No contour lines detected")
+        return [], []
 
     # Detect lines using Hough Transform
     lines = cv2.HoughLinesP(
         edges,
         rho=1,
         theta=np.pi/180,
-        threshold=80,
+        threshold=_CONTOUR_HOUGH_THRESHOLD,
         minLineLength=min_line_length,
         maxLineGap=max_line_gap
     )
@@ -534,15 +590,12 @@ def detect_contour_lines(
     dashed_lines = []
 
     if classify_types:
-        # Classify each line
-        for line in lines:
-            line_type, confidence = classify_line_type(line, edges)
-
-            if line_type == "solid":
-                solid_lines.append((line, confidence))
-            elif line_type == "dashed":
-                dashed_lines.append((line, confidence))
-            # Skip "unknown" lines
+        # Classify all lines in one pass; "unknown" lines are skipped
+        type_codes, confidences = _classify_lines(lines, edges)
+        for i in np.flatnonzero(type_codes == 1):
+            solid_lines.append((lines[i], float(confidences[i])))
+        for i in np.flatnonzero(type_codes == 2):
+            dashed_lines.append((lines[i], float(confidences[i])))
 
     logger.info(f"Classified lines: {len(solid_lines)} solid, {len(dashed_lines)} dashed")
 
@@ -552,7 +605,8 @@ def detect_contour_lines(
 def verify_contour_conventions(
     image: np.ndarray,
     text: str,
-    existing_should_be_dashed: bool = True
+    existing_should_be_dashed: bool = True,
+    classified_lines: Optional[Tuple[list, list]] = None
 ) -> Dict[str, any]:
     """
     Verify that contour line type conventions are followed.
@@ -565,6 +619,8 @@ def verify_contour_conventions(
         image: Input image (grayscale or BGR)
         text: Extracted text from OCR (for label matching)
         existing_should_be_dashed: Whether existing contours should be dashed (default: True)
+        classified_lines: (solid_lines, dashed_lines) already returned by
+            detect_contour_lines() for this image, to skip detecting them again
 
     Returns:
         Dictionary with verification results:
@@ -580,7 +636,9 @@ def verify_contour_conventions(
     from .text_detector import fuzzy_match
 
     # Detect lines and classify
-    solid_lines, dashed_lines = detect_contour_lines(image, classify_types=True)
+    if classified_lines is None:
+        classified_lines = detect_contour_lines(image, classify_types=True)
+    solid_lines, dashed_lines = classified_lines
 
     # Find contour labels in text
     has_existing = any(fuzzy_match(text, kw) for kw in ["existing", "exist", "ex"])
@@ -654,7 +712,8 @@ def verify_contour_conventions_smart(
     text: str,
     max_distance: int = 150,
     use_spatial_filtering: bool = True,
-    existing_should_be_dashed: bool = True
+    existing_should_be_dashed: bool = True,
+    classified_lines: Optional[Tuple[list, list]] = None
 ) -> Dict[str, any]:
     """
     Enhanced contour convention verification with spatial filtering (Phase 2.1).
@@ -668,6 +727,8 @@ def verify_contour_conventions_smart(
         max_distance: Maximum distance (pixels) for label-to-line association (default: 150)
         use_spatial_filtering: Enable spatial filtering (default: True)
         existing_should_be_dashed: Whether existing contours should be dashed (default: True)
+        classified_lines: (solid_lines, dashed_lines) already returned by
+            detect_contour_lines() for this image, to skip detecting them again
 
     Returns:
         Dictionary with verification results:
@@ -686,14 +747,29 @@ def verify_contour_conventions_smart(
     """
     # Import here to avoid circular dependency
     from .text_detector import (
-        extract_text_with_locations,
+        extract_text_location_arrays,
         is_contour_label,
         is_existing_contour_label,
         is_proposed_contour_label
     )
 
-    # Detect all lines
-    solid_lines, dashed_lines = detect_contour_lines(image, classify_types=True)
+    # OCR the label locations while the lines are detected; both run in
+    # native code that releases the GIL. Leaving the with block joins the
+    # OCR, so it never outlives this call (and its OCR cache writes).
+    text_future = None
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        if use_spatial_filtering:
+            text_future = executor.submit(extract_text_location_arrays, image)
+
+        # Detect all lines (once; the unfiltered fallbacks below reuse them)
+        if classified_lines is None:
+            classified_lines = detect_contour_lines(image, classify_types=True)
+        solid_lines, dashed_lines = classified_lines
+
+        # Labels aren't needed without lines; drop the OCR if it hasn't started
+        if not (solid_lines or dashed_lines) and text_future is not None:
+            text_future.cancel()
+
     all_lines = [(line, conf, 'solid') for line, conf in solid_lines] + \
                 [(line, conf, 'dashed') for line, conf in dashed_lines]
 
@@ -715,7 +791,9 @@ def verify_contour_conventions_smart(
 
     # If spatial filtering disabled, use original function
     if not use_spatial_filtering:
-        basic_results = verify_contour_conventions(image, text, existing_should_be_dashed)
+        basic_results = verify_contour_conventions(
+            image, text, existing_should_be_dashed, classified_lines=classified_lines
+        )
         basic_results.update({
             'total_lines_detected': total_lines,
             'contour_lines_identified': total_lines,
@@ -726,13 +804,14 @@ def verify_contour_conventions_smart(
         return basic_results
 
     # Extract text with locations
-    text_locations = extract_text_with_locations(image)
+    text_locations = text_future.result()
 
     # Filter for contour labels
+    label_xy = text_locations['xy'].tolist()
     contour_labels = [
-        (loc['text'], loc['x'], loc['y'])
-        for loc in text_locations
-        if is_contour_label(loc['text'])
+        (text, x, y)
+        for text, (x, y) in zip(text_locations['text'], label_xy)
+        if is_contour_label(text)
     ]
 
     contour_labels_count = len(contour_labels)
@@ -740,7 +819,9 @@ def verify_contour_conventions_smart(
 
     if contour_labels_count == 0:
         logger.warning("No contour labels detected - falling back to unfiltered detection")
-        basic_results = verify_contour_conventions(image, text, existing_should_be_dashed)
+        basic_results = verify_contour_conventions(
+            image, text, existing_should_be_dashed, classified_lines=classified_lines
+        )
         basic_results.update({
             'total_lines_detected': total_lines,
             'contour_lines_identified': total_lines,
@@ -836,6 +917,10 @@ def verify_contour_conventions_smart(
     return results
 
 
+# Labels per block in find_labels_near_lines(); caps the distance matrix size
+_LABEL_BLOCK = 256
+
+
 def find_labels_near_lines(
     text_with_locations: list,
     lines: list,
@@ -853,24 +938,36 @@ def find_labels_near_lines(
         List of (label, line_idx, distance) tuples for labels near lines
     """
     nearby_labels = []
+    if not text_with_locations or len(lines) == 0:
+        return nearby_labels
 
-    for text, x, y in text_with_locations:
-        min_distance = float('inf')
-        closest_line_idx = -1
-
-        for idx, line in enumerate(lines):
-            line_coords = line[0] if len(line.shape) == 2 else line
-            x1, y1, x2, y2 = line_coords
-
-            # Calculate distance from label to line
-            dist = point_to_line_distance((x, y), (x1, y1), (x2, y2))
-
-            if dist < min_distance:
-                min_distance = dist
-                closest_line_idx = idx
+    # Line equation: a*x + b*y + c = 0 (see point_to_line_distance)
+    coords = np.asarray(lines, dtype=np.float64).reshape(-1, 4)
+    x1, y1, x2, y2 = coords.T
+    a = y2 - y1
+    b = -(x2 - x1)
+    c = x2 * y1 - y2 * x1
+    norm = np.sqrt(a * a + b * b)
+    degenerate = norm == 0
+    safe_norm = np.where(degenerate, 1.0, norm)
+
+    points = np.array([(x, y) for _, x, y in text_with_locations], dtype=np.float64)
+
+    # Label-to-line distance matrix, a block of labels at a time to bound memory
+    for start in range(0, len(points), _LABEL_BLOCK):
+        px = points[start:start + _LABEL_BLOCK, 0:1]
+        py = points[start:start + _LABEL_BLOCK, 1:2]
+        dist = np.where(
+            degenerate,
+            np.sqrt((px - x1) ** 2 + (py - y1) ** 2),  # degenerate line (point)
+            np.abs(a * px + b * py + c) / safe_norm
+        )
+        closest = dist.argmin(axis=1)
+        min_distance = dist[np.arange(len(closest)), closest]
 
-        if min_distance <= max_distance and closest_line_idx >= 0:
-            nearby_labels.append((text, closest_line_idx, min_distance))
+        for offset in np.flatnonzero(min_distance <= max_distance):
+            text = text_with_locations[start + offset][0]
+            nearby_labels.append((text, int(closest[offset]), float(min_distance[offset])))
 
     logger.debug(f"Found {len(nearby_labels)} labels near lines")
 
@@ -896,6 +993,8 @@ def extract_street_label_locations(text: str, image: np.ndarray) -> list:
         logger.warning("pytesseract not available - cannot extract street label locations")
         return []
 
+    configure_tesseract()
+
     try:
         data = pytesseract.image_to_data(image, output_type=pytesseract.Output.DICT)
     except Exception as e:
@@ -1015,27 +1114,20 @@ def has_parallel_line_nearby(
     x1, y1, x2, y2 = line[0]
     angle = np.arctan2(y2 - y1, x2 - x1) * 180 / np.pi
 
-    for other_line in all_lines:
-        if np.array_equal(line, other_line):
-            continue
+    others = np.asarray(all_lines).reshape(-1, 4)
+    # Skip the line itself (and exact duplicates of it)
+    others = others[~(others == np.asarray(line).reshape(4)).all(axis=1)]
 
-        ox1, oy1, ox2, oy2 = other_line[0]
-        other_angle = np.arctan2(oy2 - oy1, ox2 - ox1) * 180 / np.pi
+    # Check if parallel
+    angle_diff = np.abs(angle - _line_angles(others))
+    angle_diff = np.where(angle_diff > 180, 360 - angle_diff, angle_diff)
+    parallel = (angle_diff < angle_tolerance) | (angle_diff > (180 - angle_tolerance))
 
-        # Check if parallel
-        angle_diff = abs(angle - other_angle)
-        if angle_diff > 180:
-            angle_diff = 360 - angle_diff
+    # Check distance from each parallel line's midpoint
+    midpoints = (others[parallel, :2] + others[parallel, 2:]) // 2
+    dist = _points_to_line_distance(midpoints, (x1, y1), (x2, y2))
 
-        if angle_diff < angle_tolerance or angle_diff > (180 - angle_tolerance):
-            # Check distance
-            midpoint = ((ox1 + ox2) // 2, (oy1 + oy2) // 2)
-            dist = point_to_line_distance(midpoint, (x1, y1), (x2, y2))
-
-            if distance_range[0] <= dist <= distance_range[1]:
-                return True
-
-    return False
+    return bool(np.any((distance_range[0] <= dist) & (dist <= distance_range[1])))
 
 
 def detect_sheet_type(image: np.ndarray, text: str) -> str:
@@ -1284,7 +1376,7 @@ def count_streets_on_plan(image: np.ndarray, debug: bool = False) -> Tuple[int,
     if len(image.shape) == 3:
         gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
     else:
-        gray = image.copy()
+        gray = image
 
     # Edge detection
     edges = cv2.Canny(gray, 50, 150, apertureSize=3)
@@ -6,29 +6,43 @@ Supports both PaddleOCR (primary) and Tesseract (fallback).
 Includes fuzzy matching for robust keyword detection and OCR caching.
 """
 
+import hashlib
+import json
 import logging
+import os
 import re
+import sys
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Tuple, Optional, Union
+from dataclasses import dataclass, field
 import numpy as np
-from Levenshtein import ratio as levenshtein_ratio
+from rapidfuzz import process
+from rapidfuzz.distance import Indel
 
 # Import new OCR engine abstraction (Phase 4.1)
 from .ocr_engine import (
     get_ocr_engine,
     OCRResult,
+    TesseractOCREngine,
     set_ocr_cache,
+    single_threaded_tesseract,
     get_ocr_cache,
     clear_ocr_cache
 )
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+# Set up logging (handlers are configured by the application, e.g. validate_esc.py)
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+# __slots__ drops the per-instance __dict__ (dataclass(slots=True) needs 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class DetectionResult:
     """Result of text detection for a single element."""
     element: str
@@ -60,6 +74,12 @@ REQUIRED_KEYWORDS = {
     "lot_block": ["lot", "block"],
 }
 
+# Lowercased once at import; matching runs against lowercased OCR text
+_REQUIRED_KEYWORDS_LOWER = {
+    element: tuple(keyword.lower() for keyword in keywords)
+    for element, keywords in REQUIRED_KEYWORDS.items()
+}
+
 # Minimum required quantities for critical elements
 MIN_QUANTITIES = {
     "sce": 1,  # At least 1 stabilized construction entrance
@@ -67,12 +87,249 @@ MIN_QUANTITIES = {
 }
 
 
+# OCR results keyed by image content, so re-submitting an identical image
+# (e.g. validator Step 5 after detect_required_labels, or a re-run on the
+# same sheet) skips the OCR pass entirely. Bounded LRU.
+_OCR_RESULT_CACHE_SIZE = 256
+_ocr_result_cache: "OrderedDict[tuple, List[OCRResult]]" = OrderedDict()
+_ocr_result_cache_lock = threading.Lock()
+
+
+# Optional persistent OCR results, content-addressed like the in-memory
+# cache, so re-validating the same sheets in a later run (CI, re-checks)
+# skips OCR. Off unless a directory is configured; the environment variable
+# also reaches worker processes.
+OCR_DISK_CACHE_ENV = "ESC_VALIDATOR_OCR_CACHE_DIR"
+_OCR_DISK_CACHE_VERSION = 1
+_ocr_disk_cache_dir: Optional[Path] = (
+    Path(os.environ[OCR_DISK_CACHE_ENV]) if os.environ.get(OCR_DISK_CACHE_ENV) else None
+)
+
+
+# Visual detection results (street count, north arrow template match) keyed
+# by image content, so a second detect_required_labels() call on the same
+# sheet doesn't redo the image convolutions. Small: entries are tiny but
+# one per sheet, and sheets are rarely revisited more than once.
+_VISUAL_RESULT_CACHE_SIZE = 32
+_visual_result_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_visual_result_cache_lock = threading.Lock()
+
+
+def _image_digest(image: np.ndarray) -> tuple:
+    """Identify an image by a BLAKE2 digest of its pixels plus shape and dtype."""
+    digest = hashlib.blake2b(np.ascontiguousarray(image), digest_size=16).digest()
+    return (digest, image.shape, image.dtype.str)
+
+
+def compute_image_key(image: np.ndarray) -> tuple:
+    """
+    Content key for an image, for the image_key argument of the OCR functions.
+
+    Hashing a full 300 DPI sheet takes on the order of 100 ms, so callers
+    that pass the same image to several functions compute this once. The
+    image must not be modified while its key is in use.
+    """
+    return _image_digest(image)
+
+
+def _image_cache_key(
+    image: np.ndarray,
+    lang: str,
+    ocr_engine: str,
+    min_confidence: float,
+    image_key: Optional[tuple] = None
+) -> tuple:
+    """Build an OCR cache key from a BLAKE2 digest of the image pixels."""
+    if image_key is None:
+        image_key = _image_digest(image)
+    return image_key + (lang, ocr_engine.lower(), min_confidence)
+
+
+def set_ocr_disk_cache_dir(cache_dir: Optional[Union[str, Path]]) -> None:
+    """
+    Enable the on-disk OCR result cache in cache_dir, or disable it with None.
+
+    Worker processes started afterwards only see the setting through the
+    ESC_VALIDATOR_OCR_CACHE_DIR environment variable.
+    """
+    global _ocr_disk_cache_dir
+    _ocr_disk_cache_dir = Path(cache_dir) if cache_dir else None
+
+
+def _ocr_disk_cache_path(key: tuple) -> Optional[Path]:
+    """File holding the OCR results for a cache key, or None if disabled."""
+    cache_dir = _ocr_disk_cache_dir
+    if cache_dir is None:
+        return None
+    name = hashlib.blake2b(repr((_OCR_DISK_CACHE_VERSION,) + key).encode(), digest_size=16).hexdigest()
+    return cache_dir / f"{name}.json"
+
+
+def _load_ocr_disk_cache(path: Path) -> Optional[List[OCRResult]]:
+    """Read cached OCR results; None on a miss or an unreadable file."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        return [OCRResult(text=text, confidence=confidence, bbox=tuple(bbox)) for text, confidence, bbox in rows]
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _save_ocr_disk_cache(path: Path, ocr_results: List[OCRResult]) -> None:
+    """
+    Write OCR results atomically, so concurrent workers never see partial files.
+
+    The cache is optional: a failed write is logged and never fails the OCR call.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        rows = [
+            [result.text, float(result.confidence), [int(v) for v in result.bbox]]
+            for result in ocr_results
+        ]
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(rows, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        logger.debug(f"Could not write OCR disk cache {path}: {e}")
+
+
+def _visual_cached(key: tuple, compute: Callable[[], Any]) -> Any:
+    """Return the memoized visual detection result for key, computing it on a miss."""
+    with _visual_result_cache_lock:
+        if key in _visual_result_cache:
+            _visual_result_cache.move_to_end(key)
+            return _visual_result_cache[key]
+
+    result = compute()
+
+    with _visual_result_cache_lock:
+        _visual_result_cache[key] = result
+        while len(_visual_result_cache) > _VISUAL_RESULT_CACHE_SIZE:
+            _visual_result_cache.popitem(last=False)
+
+    return result
+
+
+# Gray-level spread below which a page is treated as blank (no glyphs to find)
+_BLANK_IMAGE_CONTRAST = 16
+
+
+def _is_blank_image(image: np.ndarray) -> bool:
+    """True for empty or featureless images, e.g. a failed extraction."""
+    if image.size == 0:
+        return True
+    return int(image.max()) - int(image.min()) < _BLANK_IMAGE_CONTRAST
+
+
+def _downscale_for_ocr(image: np.ndarray, max_ocr_px: Optional[int]) -> Tuple[np.ndarray, float]:
+    """
+    Shrink image so its long edge is at most max_ocr_px.
+
+    Returns:
+        Tuple of (image to OCR, scale applied; 1.0 if unchanged)
+    """
+    long_edge = max(image.shape[:2])
+    if not max_ocr_px or long_edge <= max_ocr_px:
+        return image, 1.0
+
+    import cv2
+
+    scale = max_ocr_px / long_edge
+    logger.info(f"Downscaling image for OCR by {scale:.2f} (long edge {long_edge} -> {max_ocr_px}px)")
+    resized = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return resized, scale
+
+
+def _remember_ocr_results(key: tuple, ocr_results: List[OCRResult]) -> None:
+    """Add OCR results to the in-memory LRU, evicting the oldest entries."""
+    with _ocr_result_cache_lock:
+        _ocr_result_cache[key] = ocr_results
+        while len(_ocr_result_cache) > _OCR_RESULT_CACHE_SIZE:
+            _ocr_result_cache.popitem(last=False)
+
+
+def _run_ocr_cached(
+    image: np.ndarray,
+    lang: str,
+    ocr_engine: str,
+    min_confidence: float,
+    max_ocr_px: Optional[int] = None,
+    image_key: Optional[tuple] = None
+) -> List[OCRResult]:
+    """Run OCR through get_ocr_engine(), reusing results for identical images."""
+    key = _image_cache_key(image, lang, ocr_engine, min_confidence, image_key) + (max_ocr_px,)
+
+    with _ocr_result_cache_lock:
+        cached = _ocr_result_cache.get(key)
+        if cached is not None:
+            _ocr_result_cache.move_to_end(key)
+            logger.debug(f"OCR result cache hit ({len(cached)} elements)")
+            return cached
+
+    disk_path = _ocr_disk_cache_path(key)
+    ocr_results = _load_ocr_disk_cache(disk_path) if disk_path is not None else None
+
+    if ocr_results is not None:
+        logger.debug(f"OCR disk cache hit ({len(ocr_results)} elements)")
+        _remember_ocr_results(key, ocr_results)
+        return ocr_results
+
+    # Checked after the cache lookups, which are cheaper still
+    if _is_blank_image(image):
+        logger.warning("Image is blank, skipping OCR")
+        return []
+
+    ocr_image, scale = _downscale_for_ocr(image, max_ocr_px)
+
+    engine = get_ocr_engine(ocr_engine)
+    ocr_results = engine.extract_text(ocr_image, lang=lang, min_confidence=min_confidence)
+
+    # Report boxes in the caller's pixel coordinates, not the downscaled ones
+    if scale != 1.0:
+        ocr_results = [
+            OCRResult(
+                text=result.text,
+                confidence=result.confidence,
+                bbox=tuple(int(round(v / scale)) for v in result.bbox)
+            )
+            for result in ocr_results
+        ]
+
+    # Engines return [] on failure; don't pin a failed run in the cache
+    if ocr_results:
+        _remember_ocr_results(key, ocr_results)
+        if disk_path is not None:
+            _save_ocr_disk_cache(disk_path, ocr_results)
+
+    return ocr_results
+
+
+def clear_ocr_result_cache() -> None:
+    """Drop all OCR results memoized by image content."""
+    with _ocr_result_cache_lock:
+        _ocr_result_cache.clear()
+
+
+def clear_visual_result_cache() -> None:
+    """Drop all visual detection results memoized by image content."""
+    with _visual_result_cache_lock:
+        _visual_result_cache.clear()
+
+
 def extract_text_from_image(
     image: np.ndarray,
     lang: str = "eng",
     ocr_engine: str = "paddleocr",
     use_cache: bool = True,
-    min_confidence: float = 0.0
+    min_confidence: float = 0.0,
+    max_ocr_px: Optional[int] = None,
+    image_key: Optional[tuple] = None
 ) -> str:
     """
     Extract all text from image using OCR (Phase 4.1 Enhanced).
@@ -86,6 +343,10 @@ def extract_text_from_image(
         ocr_engine: OCR engine to use ("paddleocr" or "tesseract")
         use_cache: Whether to cache OCR results (default: True)
         min_confidence: Minimum confidence threshold 0-100 (default: 0.0)
+        max_ocr_px: Downscale so the long edge is at most this many pixels
+                    before OCR; bounding boxes are mapped back to the input
+                    image (default: None, OCR at full resolution)
+        image_key: compute_image_key(image), if already known (default: None)
 
     Returns:
         Extracted text as string
@@ -93,11 +354,10 @@ def extract_text_from_image(
     logger.info(f"Running OCR on image (engine: {ocr_engine})")
 
     try:
-        # Get OCR engine instance
-        engine = get_ocr_engine(ocr_engine)
-
-        # Extract text with bounding boxes
-        ocr_results = engine.extract_text(image, lang=lang, min_confidence=min_confidence)
+        # Extract text with bounding boxes (memoized on image content)
+        ocr_results = _run_ocr_cached(
+            image, lang, ocr_engine, min_confidence, max_ocr_px, image_key
+        )
 
         # Cache results for Phase 4 quality checks
         if use_cache:
@@ -115,32 +375,116 @@ def extract_text_from_image(
         return ""
 
 
-def extract_text_with_locations(
+def extract_ocr_results(
     image: np.ndarray,
     lang: str = "eng",
     ocr_engine: str = "paddleocr",
-    use_cached: bool = True
-) -> List[Dict]:
+    min_confidence: float = 0.0,
+    max_ocr_px: Optional[int] = None,
+    image_key: Optional[tuple] = None
+) -> List[OCRResult]:
     """
-    Extract text with bounding box locations (Phase 2.1 + Phase 4.1).
+    Get OCR results with bounding boxes for an image.
 
-    Uses cached OCR results if available, otherwise runs fresh OCR.
+    Served from the same content-keyed cache as extract_text_from_image(), so
+    calling both with the same arguments runs OCR once.
 
     Args:
         image: Preprocessed image as numpy array (grayscale or BGR)
         lang: OCR language (default: "eng")
-        ocr_engine: OCR engine to use if cache miss (default: "paddleocr")
-        use_cached: Whether to use cached results (default: True)
+        ocr_engine: OCR engine to use ("paddleocr" or "tesseract")
+        min_confidence: Minimum confidence threshold 0-100 (default: 0.0)
+        max_ocr_px: Long-edge pixel limit for OCR (default: None, full resolution)
+        image_key: compute_image_key(image), if already known (default: None)
 
     Returns:
-        List of dicts with:
-        - text: str (extracted text)
-        - x: int (center X coordinate in pixels)
-        - y: int (center Y coordinate in pixels)
-        - confidence: float (OCR confidence 0-100)
+        List of OCRResult objects (empty if OCR failed)
     """
-    logger.debug("Extracting text with bounding boxes")
+    try:
+        return _run_ocr_cached(image, lang, ocr_engine, min_confidence, max_ocr_px, image_key)
+    except Exception as e:
+        logger.error(f"OCR error: {e}")
+        return []
+
+
+def extract_text_from_images(
+    images: List[np.ndarray],
+    lang: str = "eng",
+    ocr_engine: str = "paddleocr",
+    min_confidence: float = 0.0,
+    max_workers: Optional[int] = 1
+) -> List[str]:
+    """
+    Extract text from several images with a single OCR engine instance.
+
+    The engine (and its models) is loaded once and reused for every image,
+    so validating many sheets does not pay model start-up per sheet. Results
+    are not written to the Phase 4 OCR cache, which holds a single sheet.
+
+    With Tesseract, images can be OCR'd concurrently: each call runs in its
+    own tesseract process (pytesseract) or its own per-thread tesserocr API,
+    neither of which holds the GIL while recognizing. Sequential Tesseract
+    runs go through a single tesseract invocation over all images. PaddleOCR
+    shares one predictor and always runs sequentially.
+
+    Args:
+        images: Preprocessed images as numpy arrays (grayscale or BGR)
+        lang: OCR language (default: "eng")
+        ocr_engine: OCR engine to use ("paddleocr" or "tesseract")
+        min_confidence: Minimum confidence threshold 0-100 (default: 0.0)
+        max_workers: Concurrent OCR calls (default: 1; None = CPU count)
+
+    Returns:
+        Extracted text for each image, in input order ("" for failures)
+    """
+    logger.info(f"Running OCR on {len(images)} images (engine: {ocr_engine})")
+
+    try:
+        engine = get_ocr_engine(ocr_engine)
+    except Exception as e:
+        logger.error(f"OCR error: {e}")
+        return ["" for _ in images]
+
+    def _ocr_one(image: np.ndarray) -> str:
+        try:
+            ocr_results = engine.extract_text(image, lang=lang, min_confidence=min_confidence)
+            return "\n".join(result.text for result in ocr_results)
+        except Exception as e:
+            logger.error(f"OCR error: {e}")
+            return ""
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
+    if len(images) > 1 and isinstance(engine, TesseractOCREngine):
+        if max_workers > 1:
+            with single_threaded_tesseract(), \
+                    ThreadPoolExecutor(max_workers=min(max_workers, len(images))) as executor:
+                return list(executor.map(_ocr_one, images))
 
+        # Sequential: one tesseract run over all images instead of one per image
+        try:
+            batch_results = engine.extract_text_batch(images, lang=lang, min_confidence=min_confidence)
+            return ["\n".join(result.text for result in ocr_results) for ocr_results in batch_results]
+        except Exception as e:
+            logger.error(f"OCR error: {e}")
+            return ["" for _ in images]
+
+    return [_ocr_one(image) for image in images]
+
+
+def _location_ocr_results(
+    image: np.ndarray,
+    lang: str,
+    ocr_engine: str,
+    use_cached: bool
+) -> Optional[List[OCRResult]]:
+    """
+    Get OCR results with bounding boxes, preferring the shared OCR cache.
+
+    Returns:
+        List of OCRResult objects, or None if fresh OCR failed
+    """
     # Try to use cached results first
     ocr_results = None
     if use_cached:
@@ -152,14 +496,46 @@ def extract_text_with_locations(
     if ocr_results is None:
         logger.info("No cached OCR results, running fresh OCR with bounding boxes")
         try:
-            engine = get_ocr_engine(ocr_engine)
-            ocr_results = engine.extract_text(image, lang=lang, min_confidence=0.0)
+            ocr_results = _run_ocr_cached(image, lang, ocr_engine, 0.0)
 
             # Cache for future use
             set_ocr_cache(ocr_results)
         except Exception as e:
             logger.error(f"OCR with bounding boxes error: {e}")
-            return []
+            return None
+
+    return ocr_results
+
+
+def extract_text_with_locations(
+    image: np.ndarray,
+    lang: str = "eng",
+    ocr_engine: str = "paddleocr",
+    use_cached: bool = True
+) -> List[Dict]:
+    """
+    Extract text with bounding box locations (Phase 2.1 + Phase 4.1).
+
+    Uses cached OCR results if available, otherwise runs fresh OCR.
+
+    Args:
+        image: Preprocessed image as numpy array (grayscale or BGR)
+        lang: OCR language (default: "eng")
+        ocr_engine: OCR engine to use if cache miss (default: "paddleocr")
+        use_cached: Whether to use cached results (default: True)
+
+    Returns:
+        List of dicts with:
+        - text: str (extracted text)
+        - x: int (center X coordinate in pixels)
+        - y: int (center Y coordinate in pixels)
+        - confidence: float (OCR confidence 0-100)
+    """
+    logger.debug("Extracting text with bounding boxes")
+
+    ocr_results = _location_ocr_results(image, lang, ocr_engine, use_cached)
+    if ocr_results is None:
+        return []
 
     # Convert OCRResult objects to dict format for backward compatibility
     text_locations = []
@@ -175,6 +551,60 @@ def extract_text_with_locations(
     return text_locations
 
 
+def extract_text_location_arrays(
+    image: np.ndarray,
+    lang: str = "eng",
+    ocr_engine: str = "paddleocr",
+    use_cached: bool = True
+) -> Dict[str, Any]:
+    """
+    Extract text with locations as parallel arrays instead of per-element dicts.
+
+    Same data as extract_text_with_locations(), laid out column-wise so
+    spatial queries over the label centers can be vectorized.
+
+    Args:
+        image: Preprocessed image as numpy array (grayscale or BGR)
+        lang: OCR language (default: "eng")
+        ocr_engine: OCR engine to use if cache miss (default: "paddleocr")
+        use_cached: Whether to use cached results (default: True)
+
+    Returns:
+        Dict with:
+        - text: List[str] (extracted text)
+        - xy: np.ndarray of shape (N, 2), int32 (center X, Y in pixels)
+        - conf: np.ndarray of shape (N,), float32 (OCR confidence 0-100)
+    """
+    ocr_results = _location_ocr_results(image, lang, ocr_engine, use_cached) or []
+
+    n = len(ocr_results)
+    bboxes = np.fromiter(
+        (v for result in ocr_results for v in result.bbox),
+        dtype=np.float64, count=4 * n
+    ).reshape(n, 4)
+
+    # Truncate toward zero like int(center) in extract_text_with_locations
+    xy = ((bboxes[:, 0:2] + bboxes[:, 2:4]) / 2).astype(np.int32)
+
+    return {
+        'text': [result.text for result in ocr_results],
+        'xy': xy,
+        'conf': np.fromiter(
+            (result.confidence for result in ocr_results),
+            dtype=np.float32, count=n
+        ),
+    }
+
+
+# Contour keywords: 'contour', 'existing', 'proposed', 'elev', 'elevation',
+# 'ex', 'prop'. Substring matching, so the longer forms are covered by
+# 'ex', 'prop' and 'elev'.
+_CONTOUR_KEYWORD_RE = re.compile(r'contour|elev|ex|prop')
+
+# Elevation number; anything this matches is a valid float() literal
+_ELEVATION_RE = re.compile(r'^\d{2,3}\.?\d*$')
+
+
 def is_contour_label(text: str) -> bool:
     """
     Check if text is likely a contour label (Phase 2.1).
@@ -187,26 +617,23 @@ def is_contour_label(text: str) -> bool:
     Returns:
         True if text appears to be a contour label, False otherwise
     """
-    text_lower = text.lower()
-
     # Keywords that indicate contour labels
-    keywords = ['contour', 'existing', 'proposed', 'elev', 'elevation', 'ex', 'prop']
-    if any(kw in text_lower for kw in keywords):
+    if _CONTOUR_KEYWORD_RE.search(text.lower()):
         return True
 
     # Numeric elevation pattern (e.g., "100", "105.5")
     # Contours typically in range 50-500 for Austin area
-    if re.match(r'^\d{2,3}\.?\d*$', text):
-        try:
-            value = float(text)
-            if 50 <= value <= 500:
-                return True
-        except ValueError:
-            pass
+    match = _ELEVATION_RE.match(text)
+    if match and 50 <= float(match.group()) <= 500:
+        return True
 
     return False
 
 
+_EXISTING_CONTOUR_RE = re.compile(r'exist|ex contour|^ex(?:\Z|[ .])')
+_PROPOSED_CONTOUR_RE = re.compile(r'prop|future|new')
+
+
 def is_existing_contour_label(text: str) -> bool:
     """
     Check if text indicates an existing contour (Phase 2.1).
@@ -217,17 +644,9 @@ def is_existing_contour_label(text: str) -> bool:
     Returns:
         True if text indicates existing contour, False otherwise
     """
-    text_lower = text.lower().strip()
-
-    # Check for full keywords first
-    if any(kw in text_lower for kw in ['existing', 'exist']):
-        return True
-
-    # Check for standalone 'ex' or 'ex' with punctuation/space
-    if text_lower == 'ex' or text_lower.startswith('ex ') or text_lower.startswith('ex.') or 'ex contour' in text_lower:
-        return True
-
-    return False
+    # 'existing'/'exist' anywhere, 'ex contour' anywhere, or a standalone
+    # leading 'ex' ("ex", "ex ...", "ex.")
+    return bool(_EXISTING_CONTOUR_RE.search(text.lower().strip()))
 
 
 def is_proposed_contour_label(text: str) -> bool:
@@ -240,10 +659,106 @@ def is_proposed_contour_label(text: str) -> bool:
     Returns:
         True if text indicates proposed contour, False otherwise
     """
-    text_lower = text.lower()
-    proposed_keywords = ['proposed', 'prop', 'future', 'new']
+    # 'proposed', 'prop', 'future', 'new' ('prop' covers 'proposed')
+    return bool(_PROPOSED_CONTOUR_RE.search(text.lower()))
+
+
+def _group_words_by_length(words: List[str]) -> Dict[int, Dict[str, int]]:
+    """
+    Bucket OCR words by length, keeping each distinct word once with its frequency.
+
+    Drawing sheets repeat the same labels many times, so fuzzy scoring only
+    distinct words (and weighting by frequency when counting) cuts the number
+    of edit-distance calls well below the raw token count.
+    """
+    words_by_length: Dict[int, Dict[str, int]] = {}
+    for word in words:
+        bucket = words_by_length.setdefault(len(word), {})
+        bucket[word] = bucket.get(word, 0) + 1
+    return words_by_length
+
+
+@dataclass
+class _PreparedText:
+    """
+    OCR text lowercased and tokenized once, shared by every keyword check.
+
+    Exact keyword counts are memoized, so the presence test in detection and
+    the occurrence count for the same keyword cost one scan of the text
+    between them, across all checklist elements.
+    """
+    text_lower: str
+    words_by_length: Dict[int, Dict[str, int]]
+    exact_counts: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_text(cls, text: str) -> "_PreparedText":
+        text_lower = text.lower()
+        return cls(text_lower, _group_words_by_length(text_lower.split()))
+
+    def exact_count(self, keyword_lower: str) -> int:
+        """Non-overlapping occurrences of keyword_lower (same as str.count)."""
+        count = self.exact_counts.get(keyword_lower)
+        if count is None:
+            count = self.text_lower.count(keyword_lower)
+            self.exact_counts[keyword_lower] = count
+        return count
+
+
+def _candidate_buckets(
+    words_by_length: Dict[int, Dict[str, int]],
+    keyword_len: int,
+    threshold: float
+) -> List[Tuple[Dict[str, int], int]]:
+    """
+    Return (bucket, max_distance) for each word-length bucket that can still match.
+
+    The normalized Indel similarity is ``1 - dist / (len_a + len_b)``, so for a
+    fixed word length the threshold becomes an integer distance bound
+    ``max_distance = floor((1 - threshold) * (len_a + len_b))``. Since the
+    distance is at least ``|len_a - len_b|``, buckets whose length difference
+    already exceeds the bound are skipped without calling the edit-distance
+    kernel. For short keywords like "sf" or "ex" this rejects most of the page.
+    """
+    slack = 1.0 - threshold
+    buckets = []
+    for length, bucket in words_by_length.items():
+        # Small epsilon so float rounding never drops a true match
+        max_distance = int(slack * (length + keyword_len) + 1e-9)
+        if abs(length - keyword_len) <= max_distance:
+            buckets.append((bucket, max_distance))
+    return buckets
+
+
+def _fuzzy_match_prepared(prepared: _PreparedText, keyword_lower: str, threshold: float) -> bool:
+    """
+    Fuzzy match against text that has already been lowercased and tokenized.
+
+    Args:
+        prepared: Text from _PreparedText.from_text()
+        keyword_lower: Lowercased keyword to search for
+        threshold: Minimum similarity ratio (0.0 to 1.0)
+
+    Returns:
+        True if fuzzy match found, False otherwise
+    """
+    # First try exact match (faster)
+    if prepared.exact_count(keyword_lower) > 0:
+        return True
+
+    # Try fuzzy matching on words that pass the length bound. An integer
+    # distance cutoff lets RapidFuzz stop each comparison as soon as the
+    # bound is exceeded.
+    for bucket, max_distance in _candidate_buckets(
+        prepared.words_by_length, len(keyword_lower), threshold
+    ):
+        best = process.extractOne(
+            keyword_lower, bucket.keys(), scorer=Indel.distance, score_cutoff=max_distance
+        )
+        if best is not None:
+            return True
 
-    return any(kw in text_lower for kw in proposed_keywords)
+    return False
 
 
 def fuzzy_match(text: str, keyword: str, threshold: float = 0.8) -> bool:
@@ -258,20 +773,28 @@ def fuzzy_match(text: str, keyword: str, threshold: float = 0.8) -> bool:
     Returns:
         True if fuzzy match found, False otherwise
     """
-    text_lower = text.lower()
-    keyword_lower = keyword.lower()
+    return _fuzzy_match_prepared(_PreparedText.from_text(text), keyword.lower(), threshold)
 
-    # First try exact match (faster)
-    if keyword_lower in text_lower:
-        return True
 
-    # Try fuzzy matching on words
-    words = text_lower.split()
-    for word in words:
-        if levenshtein_ratio(word, keyword_lower) >= threshold:
-            return True
+def _detect_keyword_prepared(
+    prepared: _PreparedText,
+    keywords: List[str],
+    keywords_lower: Tuple[str, ...],
+    fuzzy: bool = True,
+    threshold: float = 0.8
+) -> Tuple[bool, List[str]]:
+    """Same as detect_keyword() but on a _PreparedText and pre-lowercased keywords."""
+    matches = []
 
-    return False
+    for keyword, keyword_lower in zip(keywords, keywords_lower):
+        if fuzzy:
+            if _fuzzy_match_prepared(prepared, keyword_lower, threshold):
+                matches.append(keyword)
+        else:
+            if prepared.exact_count(keyword_lower) > 0:
+                matches.append(keyword)
+
+    return len(matches) > 0, matches
 
 
 def detect_keyword(text: str, keywords: List[str], fuzzy: bool = True, threshold: float = 0.8) -> Tuple[bool, List[str]]:
@@ -287,17 +810,91 @@ def detect_keyword(text: str, keywords: List[str], fuzzy: bool = True, threshold
     Returns:
         Tuple of (found, matched_keywords)
     """
-    matches = []
+    keywords_lower = tuple(keyword.lower() for keyword in keywords)
+    return _detect_keyword_prepared(
+        _PreparedText.from_text(text), keywords, keywords_lower, fuzzy, threshold
+    )
+
+
+def _count_keyword_occurrences_prepared(
+    prepared: _PreparedText,
+    keywords_lower: Tuple[str, ...],
+    fuzzy: bool = True,
+    threshold: float = 0.85
+) -> int:
+    """Same as count_keyword_occurrences() but on a _PreparedText and pre-lowercased keywords."""
+    count = 0
+
+    # For each keyword, count occurrences
+    for keyword_lower in keywords_lower:
+        # Count exact matches first
+        count += prepared.exact_count(keyword_lower)
 
-    for keyword in keywords:
+        # If fuzzy matching enabled, count fuzzy matches
         if fuzzy:
-            if fuzzy_match(text, keyword, threshold):
-                matches.append(keyword)
-        else:
-            if keyword.lower() in text.lower():
-                matches.append(keyword)
+            for bucket, max_distance in _candidate_buckets(
+                prepared.words_by_length, len(keyword_lower), threshold
+            ):
+                fuzzy_hits = process.extract(
+                    keyword_lower, bucket.keys(), scorer=Indel.distance,
+                    score_cutoff=max_distance, limit=None
+                )
+                # Avoid double-counting exact matches; weight distinct words by frequency
+                count += sum(bucket[word] for word, _, _ in fuzzy_hits if word != keyword_lower)
 
-    return len(matches) > 0, matches
+    return count
+
+
+def _detect_and_count_prepared(
+    prepared: _PreparedText,
+    keywords: List[str],
+    keywords_lower: Tuple[str, ...],
+    detect_threshold: float = 0.8,
+    count_threshold: float = 0.85
+) -> Tuple[bool, List[str], int]:
+    """
+    Fused _detect_keyword_prepared() + _count_keyword_occurrences_prepared().
+
+    Scores each candidate word once per keyword with the looser of the two
+    distance bounds and derives both the detection and the count from that
+    single pass. Results are identical to calling the two helpers back to back.
+
+    Returns:
+        Tuple of (found, matched_keywords, occurrence_count)
+    """
+    matches = []
+    count = 0
+
+    for keyword, keyword_lower in zip(keywords, keywords_lower):
+        exact_count = prepared.exact_count(keyword_lower)
+        count += exact_count
+        matched = exact_count > 0
+
+        keyword_len = len(keyword_lower)
+        for length, bucket in prepared.words_by_length.items():
+            detect_max = int((1.0 - detect_threshold) * (length + keyword_len) + 1e-9)
+            count_max = int((1.0 - count_threshold) * (length + keyword_len) + 1e-9)
+            # Fuzzy detection is only needed if there was no exact hit
+            if matched:
+                detect_max = -1
+            cutoff = max(detect_max, count_max)
+            if abs(length - keyword_len) > cutoff:
+                continue
+
+            for word, distance, _ in process.extract(
+                keyword_lower, bucket.keys(), scorer=Indel.distance,
+                score_cutoff=cutoff, limit=None
+            ):
+                if distance <= detect_max:
+                    matched = True
+                # Avoid double-counting exact matches; weight distinct words by frequency
+                if distance <= count_max and word != keyword_lower:
+                    count += bucket[word]
+
+        if matched:
+            matches.append(keyword)
+
+    return len(matches) > 0, matches, count
 
 
 def count_keyword_occurrences(text: str, keywords: List[str], fuzzy: bool = True, threshold: float = 0.85) -> int:
@@ -315,25 +912,35 @@ def count_keyword_occurrences(text: str, keywords: List[str], fuzzy: bool = True
     Returns:
         Total count of keyword occurrences
     """
-    count = 0
-    text_lower = text.lower()
+    keywords_lower = tuple(keyword.lower() for keyword in keywords)
+    return _count_keyword_occurrences_prepared(
+        _PreparedText.from_text(text), keywords_lower, fuzzy, threshold
+    )
 
-    # For each keyword, count occurrences
-    for keyword in keywords:
-        keyword_lower = keyword.lower()
 
-        # Count exact matches first
-        count += text_lower.count(keyword_lower)
+# Common note indicators for is_likely_notes_section(): 'shall', 'shall be',
+# 'must', 'contractor', 'the ', 'all ', 'requirements', 'standards',
+# 'prior to', 'in accordance' (substring match; 'shall' covers 'shall be')
+_NOTE_WORDS_RE = re.compile(
+    r'shall|must|contractor|the |all |requirements|standards|prior to|in accordance'
+)
 
-        # If fuzzy matching enabled, count fuzzy matches
-        if fuzzy:
-            words = text_lower.split()
-            for word in words:
-                # Avoid double-counting exact matches
-                if word != keyword_lower and levenshtein_ratio(word, keyword_lower) >= threshold:
-                    count += 1
 
-    return count
+_ASCII_LOWERCASE = bytes(range(ord('a'), ord('z') + 1))
+_ASCII_UPPERCASE = bytes(range(ord('A'), ord('Z') + 1))
+
+
+def _count_letter_case(line: str) -> Tuple[int, int]:
+    """Return (lowercase, uppercase) character counts for a line."""
+    if line.isascii():
+        # For ASCII, str.islower/isupper per character is exactly a-z/A-Z;
+        # count by deleting those bytes in C instead of a per-char loop
+        data = line.encode('ascii')
+        return (
+            len(data) - len(data.translate(None, _ASCII_LOWERCASE)),
+            len(data) - len(data.translate(None, _ASCII_UPPERCASE)),
+        )
+    return sum(map(str.islower, line)), sum(map(str.isupper, line))
 
 
 def is_likely_notes_section(line: str) -> bool:
@@ -355,25 +962,33 @@ def is_likely_notes_section(line: str) -> bool:
     if len(line) > 100:
         return True
 
-    # Count lowercase vs uppercase
-    lowercase_count = sum(1 for c in line if c.islower())
-    uppercase_count = sum(1 for c in line if c.isupper())
+    # Mostly lowercase = notes. ALL CAPS lines (the usual plan label) have no
+    # lowercase characters, so skip the per-character counts for them.
+    if not line.isupper():
+        lowercase_count, uppercase_count = _count_letter_case(line)
 
-    # Mostly lowercase = notes
-    if lowercase_count > uppercase_count * 2:
-        return True
+        if lowercase_count > uppercase_count * 2:
+            return True
 
     # Common note indicators
-    note_words = [
-        'shall', 'shall be', 'must', 'contractor', 'the ', 'all ',
-        'requirements', 'standards', 'prior to', 'in accordance'
-    ]
+    return bool(_NOTE_WORDS_RE.search(line.lower()))
 
-    line_lower = line.lower()
-    if any(word in line_lower for word in note_words):
-        return True
 
-    return False
+# Street name patterns, compiled once
+# Format: "Name + Suffix" in Title Case or ALL CAPS
+_STREET_LABEL_PATTERNS = (
+    # Title Case: "North Loop Blvd"
+    re.compile(r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Street|St|Boulevard|Blvd|Drive|Dr|Way|Lane|Ln|Road|Rd|Avenue|Ave|Court|Ct|Circle|Cir|Place|Pl)\b'),
+    # ALL CAPS: "WILLIAM CANNON DR"
+    re.compile(r'\b([A-Z\s]+)\s+(STREET|ST|BOULEVARD|BLVD|DRIVE|DR|WAY|LANE|LN|ROAD|RD|AVENUE|AVE|COURT|CT|CIRCLE|CIR|PLACE|PL)\b'),
+)
+
+# Both patterns end in a whitespace-preceded suffix, so a line with no
+# standalone suffix word can't match either; most lines fail this one scan
+_STREET_SUFFIX_RE = re.compile(
+    r'\b(?:Street|St|Boulevard|Blvd|Drive|Dr|Way|Lane|Ln|Road|Rd|Avenue|Ave|Court|Ct|Circle|Cir|Place|Pl'
+    r'|STREET|ST|BOULEVARD|BLVD|DRIVE|DR|WAY|LANE|LN|ROAD|RD|AVENUE|AVE|COURT|CT|CIRCLE|CIR|PLACE|PL)\b'
+)
 
 
 def detect_street_labels_smart(text: str) -> Tuple[bool, int, List[str]]:
@@ -388,30 +1003,25 @@ def detect_street_labels_smart(text: str) -> Tuple[bool, int, List[str]]:
     Returns:
         Tuple of (detected, count, street_names)
     """
-    # Street name patterns
-    # Format: "Name + Suffix" in Title Case or ALL CAPS
-    patterns = [
-        # Title Case: "North Loop Blvd"
-        r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\s+(Street|St|Boulevard|Blvd|Drive|Dr|Way|Lane|Ln|Road|Rd|Avenue|Ave|Court|Ct|Circle|Cir|Place|Pl)\b',
-        # ALL CAPS: "WILLIAM CANNON DR"
-        r'\b([A-Z\s]+)\s+(STREET|ST|BOULEVARD|BLVD|DRIVE|DR|WAY|LANE|LN|ROAD|RD|AVENUE|AVE|COURT|CT|CIRCLE|CIR|PLACE|PL)\b'
+    # Candidate label lines: a suffix word present (cheap prefilter) and
+    # not from a notes section
+    label_lines = [
+        line for line in text.split('\n')
+        if _STREET_SUFFIX_RE.search(line) and not is_likely_notes_section(line)
     ]
 
-    street_names = set()
-    lines = text.split('\n')
-
-    for line in lines:
-        # Skip notes sections
-        if is_likely_notes_section(line):
-            continue
-
-        # Find street name patterns
-        for pattern in patterns:
-            matches = re.findall(pattern, line)
-            for match in matches:
-                # match is tuple: (name, suffix)
-                full_name = f"{match[0].strip()} {match[1]}"
-                street_names.add(full_name)
+    # The ALL CAPS name group allows whitespace and would run across line
+    # breaks, so join on NUL instead: no pattern can match it, and it acts as
+    # a word boundary just like the ends of a separate line. One scan per
+    # pattern then finds exactly the per-line matches.
+    label_text = '\x00'.join(label_lines)
+
+    # Groups: (name, suffix); the ALL CAPS name can start with whitespace
+    street_names = {
+        f"{name.strip()} {suffix}"
+        for pattern in _STREET_LABEL_PATTERNS
+        for name, suffix in pattern.findall(label_text)
+    }
 
     detected = len(street_names) > 0
     count = len(street_names)
@@ -569,6 +1179,17 @@ def verify_street_labeling_complete(
         )
 
 
+# Elevations / lot / block numbers
+_NUMBER_RE = re.compile(r'\b\d+\.?\d*\b')
+
+
+@lru_cache(maxsize=32)
+def _context_lines_pattern(context_keywords: Tuple[str, ...]) -> "re.Pattern":
+    """Compile a pattern matching every whole line that contains any context keyword."""
+    alternation = '|'.join(re.escape(keyword.lower()) for keyword in context_keywords)
+    return re.compile(r'^.*(?:' + alternation + r').*$', re.IGNORECASE | re.MULTILINE)
+
+
 def detect_numeric_labels(text: str, context_keywords: List[str]) -> Tuple[bool, int]:
     """
     Detect numeric labels near context keywords (for contours, lots, blocks).
@@ -580,34 +1201,235 @@ def detect_numeric_labels(text: str, context_keywords: List[str]) -> Tuple[bool,
     Returns:
         Tuple of (found, count) where count is number of numeric labels found
     """
-    # Find lines containing context keywords
-    lines = text.split('\n')
-    relevant_lines = []
+    if not context_keywords:
+        return False, 0
 
-    for line in lines:
-        for keyword in context_keywords:
-            if keyword.lower() in line.lower():
-                relevant_lines.append(line)
-                break
+    return _count_numeric_labels(_context_lines_pattern(tuple(context_keywords)), text)
 
-    # Extract numeric patterns from relevant lines
-    # Look for numbers that could be elevations or lot/block numbers
-    numeric_pattern = r'\b\d+\.?\d*\b'
-    count = 0
 
-    for line in relevant_lines:
-        numbers = re.findall(numeric_pattern, line)
-        count += len(numbers)
+def _count_numeric_labels(context_pattern: "re.Pattern", text: str) -> Tuple[bool, int]:
+    """Count numbers on the lines matched by a _context_lines_pattern()."""
+    # Single sweep over the text for lines containing any context keyword,
+    # then count numbers that could be elevations or lot/block numbers
+    count = 0
+    for line_match in context_pattern.finditer(text):
+        count += len(_NUMBER_RE.findall(line_match.group()))
 
     return count > 0, count
 
 
+# Checklist elements detected by counting numbers on context lines, with
+# their context patterns compiled once at import
+_NUMERIC_CONTEXT_RE = {
+    element: _context_lines_pattern(_REQUIRED_KEYWORDS_LOWER[element])
+    for element in ("existing_contours", "proposed_contours", "lot_block")
+}
+
+
+def _visual_street_result(
+    image: np.ndarray,
+    full_text: str,
+    image_key: tuple
+) -> DetectionResult:
+    """Street labeling check with visual street counting (Phase 1.3)."""
+    # Import here to avoid circular dependency
+    try:
+        from .symbol_detector import count_streets_on_plan
+        return _visual_cached(
+            image_key + ("streets", full_text),
+            lambda: verify_street_labeling_complete(image, full_text, count_streets_on_plan)
+        )
+    except ImportError as e:
+        logger.warning(f"Visual detection unavailable: {e}. Falling back to text-only.")
+        detected, count, matches = detect_street_labels_smart(full_text)
+        return DetectionResult(
+            element="streets",
+            detected=detected,
+            confidence=0.75 if detected else 0.0,
+            count=count,
+            matches=matches[:10],
+            notes=f"Found {count} labeled street(s). Visual verification unavailable."
+        )
+
+
+def _visual_north_arrow_result(
+    image: np.ndarray,
+    template_dir: Optional[Path],
+    image_key: tuple
+) -> DetectionResult:
+    """North arrow symbol detection via multi-scale template matching (Phase 1.3.1)."""
+    try:
+        from .symbol_detector import detect_north_arrow_multiscale
+
+        # Auto-detect template path if not provided
+        if template_dir is None:
+            # Assume templates are in same directory as this module
+            module_dir = Path(__file__).parent
+            template_path = module_dir.parent / "templates" / "north_arrow.png"
+        else:
+            template_path = template_dir / "north_arrow.png"
+
+        if not template_path.exists():
+            # Template not found, fall back
+            logger.warning(f"North arrow template not found: {template_path}")
+            raise FileNotFoundError("Template not found")
+
+        # Phase 1.3.1: Use multi-scale detection for better accuracy
+        detected, confidence, location = _visual_cached(
+            image_key + ("north_arrow", str(template_path)),
+            lambda: detect_north_arrow_multiscale(image, template_path)
+        )
+
+        if detected and confidence > 0.75:
+            # High confidence detection
+            notes = f"North arrow symbol detected at {location} (high confidence)" if location else "North arrow symbol detected (high confidence)"
+        elif detected:
+            # Moderate confidence
+            notes = f"North arrow detected at {location} (confidence: {confidence:.1%})" if location else f"North arrow detected (confidence: {confidence:.1%})"
+        else:
+            # Not detected
+            notes = "North arrow not detected via multi-scale template matching"
+
+        return DetectionResult(
+            element="north_bar",
+            detected=detected,
+            confidence=confidence,
+            count=1 if detected else 0,
+            matches=["North arrow symbol"] if detected else [],
+            notes=notes
+        )
+
+    except (ImportError, FileNotFoundError) as e:
+        logger.warning(f"Visual north arrow detection unavailable: {e}. Falling back to text-based.")
+        return DetectionResult(
+            element="north_bar",
+            detected=False,
+            confidence=0.0,
+            count=0,
+            matches=[],
+            notes="Symbol detection unavailable. Manual verification required."
+        )
+
+
+@dataclass
+class _DetectionContext:
+    """Per-sheet inputs shared by the detect_required_labels element handlers."""
+    full_text: str
+    prepared: _PreparedText
+    enable_visual_detection: bool
+    run_visual: Callable[[str], DetectionResult]
+
+
+def _detect_streets_element(element: str, context: _DetectionContext) -> DetectionResult:
+    """Phase 1.3: Complete street labeling verification (text + visual)."""
+    if context.enable_visual_detection:
+        return context.run_visual(element)
+
+    # Phase 1.2: Text-only detection
+    detected, count, matches = detect_street_labels_smart(context.full_text)
+    return DetectionResult(
+        element=element,
+        detected=detected,
+        confidence=0.75 if detected else 0.0,
+        count=count,
+        matches=matches[:10],
+        notes=f"Found {count} labeled street(s)"
+    )
+
+
+def _detect_north_bar_element(element: str, context: _DetectionContext) -> DetectionResult:
+    """Phase 1.3.1: North arrow symbol detection (multi-scale), else text-based."""
+    if context.enable_visual_detection:
+        return context.run_visual(element)
+
+    # Phase 1.2: Text-based detection (limited)
+    north_count = context.prepared.exact_count('north')
+
+    if north_count > 50:
+        detected = False
+        confidence = 0.0
+        notes = "Text-only detection unreliable for graphic symbols."
+    elif 1 <= north_count <= 10:
+        detected = True
+        confidence = 0.3
+        notes = "Possible north arrow detected via text. Enable visual detection for better accuracy."
+    else:
+        detected = False
+        confidence = 0.0
+        notes = "No north arrow detected via text. Enable visual detection."
+
+    return DetectionResult(
+        element=element,
+        detected=detected,
+        confidence=confidence,
+        count=north_count if north_count <= 10 else 0,
+        matches=[],
+        notes=notes
+    )
+
+
+def _detect_numeric_element(element: str, context: _DetectionContext) -> DetectionResult:
+    """Numeric labels near context keywords (contours, lot/block)."""
+    detected, count = _count_numeric_labels(_NUMERIC_CONTEXT_RE[element], context.full_text)
+    return DetectionResult(
+        element=element,
+        detected=detected,
+        confidence=0.7 if detected else 0.0,  # Lower confidence for numeric detection
+        count=count,
+        matches=[f"Found {count} numeric labels"] if detected else [],
+        notes="Numeric label detection requires manual verification"
+    )
+
+
+def _detect_keyword_element(element: str, context: _DetectionContext) -> DetectionResult:
+    """Standard keyword detection with fuzzy matching."""
+    detected, matches, count = _detect_and_count_prepared(
+        context.prepared, REQUIRED_KEYWORDS[element], _REQUIRED_KEYWORDS_LOWER[element],
+        detect_threshold=0.8, count_threshold=0.85
+    )
+    confidence = 0.9 if detected else 0.0
+
+    # Adjust confidence based on number of matches
+    if detected and count > 1:
+        confidence = min(0.95, 0.9 + (count * 0.01))
+
+    notes = ""
+
+    # False positive filtering: excessive occurrences likely from notes/text
+    if count > 50:
+        # Suspiciously high - likely counting text mentions
+        confidence *= 0.3  # Reduce confidence drastically
+        detected = False   # Mark as not detected
+        notes = f"Excessive occurrences ({count}), likely false positive from notes/text"
+        logger.warning("%s: %d occurrences - likely false positive", element, count)
+
+    return DetectionResult(
+        element=element,
+        detected=detected,
+        confidence=confidence,
+        count=count,
+        matches=matches,
+        notes=notes
+    )
+
+
+# Elements with dedicated detection; everything else is keyword detection
+_ELEMENT_HANDLERS: Dict[str, Callable[[str, _DetectionContext], DetectionResult]] = {
+    "streets": _detect_streets_element,
+    "north_bar": _detect_north_bar_element,
+    **{element: _detect_numeric_element for element in _NUMERIC_CONTEXT_RE},
+}
+
+
 def detect_required_labels(
     image: np.ndarray,
     checklist_elements: Optional[List[str]] = None,
     enable_visual_detection: bool = True,
     template_dir: Optional[Path] = None,
-    ocr_engine: str = "tesseract"
+    ocr_engine: str = "tesseract",
+    min_confidence: float = 0.0,
+    max_ocr_px: Optional[int] = None,
+    image_key: Optional[tuple] = None
 ) -> Dict[str, DetectionResult]:
     """
     Detect all required labels from the ESC checklist.
@@ -620,6 +1442,12 @@ def detect_required_labels(
                            If None, checks all elements.
         enable_visual_detection: Enable Phase 1.3 visual detection (default: True)
         template_dir: Directory containing symbol templates (default: None, auto-detect)
+        ocr_engine: OCR engine to use ("paddleocr" or "tesseract")
+        min_confidence: Drop OCR words below this confidence (0-100) before
+                        keyword matching (default: 0.0, keep everything)
+        max_ocr_px: Downscale so the long edge is at most this many pixels
+                    before OCR (default: None, OCR at full resolution)
+        image_key: compute_image_key(image), if already known (default: None)
 
     Returns:
         Dictionary mapping element names to DetectionResult objects
@@ -632,192 +1460,135 @@ def detect_required_labels(
     logger.info("Starting required label detection (Phase 1.2 + 1.3)")
 
     # Extract all text from image
-    full_text = extract_text_from_image(image, ocr_engine=ocr_engine)
+    # OCR and visual results are memoized on image content; hash the pixels once
+    if image_key is None:
+        image_key = _image_digest(image)
+
+    full_text = extract_text_from_image(
+        image, ocr_engine=ocr_engine, min_confidence=min_confidence,
+        max_ocr_px=max_ocr_px, image_key=image_key
+    )
 
     if not full_text.strip():
         logger.warning("No text extracted from image - OCR may have failed")
 
+    # Lowercase and tokenize once; every keyword check below reuses these
+    prepared = _PreparedText.from_text(full_text)
+
     # Determine which elements to check
     if checklist_elements is None:
         checklist_elements = list(REQUIRED_KEYWORDS.keys())
 
+    # The visual checks are OpenCV-bound and release the GIL. When both are
+    # requested, start them together and score the text elements meanwhile.
+    visual_tasks = {
+        "streets": lambda: _visual_street_result(image, full_text, image_key),
+        "north_bar": lambda: _visual_north_arrow_result(image, template_dir, image_key),
+    }
+    visual_jobs = {}
+    if enable_visual_detection:
+        requested = [element for element in visual_tasks if element in checklist_elements]
+        if len(requested) > 1:
+            executor = ThreadPoolExecutor(max_workers=len(requested))
+            visual_jobs = {element: executor.submit(visual_tasks[element]) for element in requested}
+            # Submitted jobs still run to completion; the loop collects them
+            executor.shutdown(wait=False)
+
+    def run_visual(element: str) -> DetectionResult:
+        job = visual_jobs.get(element)
+        return job.result() if job is not None else visual_tasks[element]()
+
+    context = _DetectionContext(
+        full_text=full_text,
+        prepared=prepared,
+        enable_visual_detection=enable_visual_detection,
+        run_visual=run_visual
+    )
+
     results = {}
 
     # Check each element
     for element in checklist_elements:
         if element not in REQUIRED_KEYWORDS:
-            logger.warning(f"Unknown element: {element}")
+            logger.warning("Unknown element: %s", element)
             continue
 
-        keywords = REQUIRED_KEYWORDS[element]
-
-        # Phase 1.3: Complete street labeling verification (text + visual)
-        if element == "streets":
-            if enable_visual_detection:
-                # Import here to avoid circular dependency
-                try:
-                    from .symbol_detector import count_streets_on_plan
-                    result = verify_street_labeling_complete(image, full_text, count_streets_on_plan)
-                except ImportError as e:
-                    logger.warning(f"Visual detection unavailable: {e}. Falling back to text-only.")
-                    detected, count, matches = detect_street_labels_smart(full_text)
-                    result = DetectionResult(
-                        element="streets",
-                        detected=detected,
-                        confidence=0.75 if detected else 0.0,
-                        count=count,
-                        matches=matches[:10],
-                        notes=f"Found {count} labeled street(s). Visual verification unavailable."
-                    )
-            else:
-                # Phase 1.2: Text-only detection
-                detected, count, matches = detect_street_labels_smart(full_text)
-                result = DetectionResult(
-                    element="streets",
-                    detected=detected,
-                    confidence=0.75 if detected else 0.0,
-                    count=count,
-                    matches=matches[:10],
-                    notes=f"Found {count} labeled street(s)"
-                )
+        handler = _ELEMENT_HANDLERS.get(element, _detect_keyword_element)
+        result = handler(element, context)
+        results[element] = result
 
-            results[element] = result
-
-            # Log result
-            status = "✓" if result.detected else "✗"
-            logger.info(f"{status} {element}: detected={result.detected}, count={result.count}, confidence={result.confidence:.2f}")
-            continue  # Skip normal keyword detection
-
-        # Phase 1.3.1: North arrow symbol detection (multi-scale)
-        if element == "north_bar":
-            if enable_visual_detection:
-                # Try visual symbol detection
-                try:
-                    from .symbol_detector import detect_north_arrow_multiscale
-
-                    # Auto-detect template path if not provided
-                    if template_dir is None:
-                        # Assume templates are in same directory as this module
-                        module_dir = Path(__file__).parent
-                        template_path = module_dir.parent / "templates" / "north_arrow.png"
-                    else:
-                        template_path = template_dir / "north_arrow.png"
-
-                    if template_path.exists():
-                        # Phase 1.3.1: Use multi-scale detection for better accuracy
-                        detected, confidence, location = detect_north_arrow_multiscale(image, template_path)
-
-                        if detected and confidence > 0.75:
-                            # High confidence detection
-                            notes = f"North arrow symbol detected at {location} (high confidence)" if location else "North arrow symbol detected (high confidence)"
-                        elif detected:
-                            # Moderate confidence
-                            notes = f"North arrow detected at {location} (confidence: {confidence:.1%})" if location else f"North arrow detected (confidence: {confidence:.1%})"
-                        else:
-                            # Not detected
-                            notes = "North arrow not detected via multi-scale template matching"
-
-                        results[element] = DetectionResult(
-                            element=element,
-                            detected=detected,
-                            confidence=confidence,
-                            count=1 if detected else 0,
-                            matches=["North arrow symbol"] if detected else [],
-                            notes=notes
-                        )
-                    else:
-                        # Template not found, fall back
-                        logger.warning(f"North arrow template not found: {template_path}")
-                        raise FileNotFoundError("Template not found")
-
-                except (ImportError, FileNotFoundError) as e:
-                    logger.warning(f"Visual north arrow detection unavailable: {e}. Falling back to text-based.")
-                    # Fall through to text-based detection
-                    detected = False
-                    confidence = 0.0
-                    notes = "Symbol detection unavailable. Manual verification required."
-
-                    results[element] = DetectionResult(
-                        element=element,
-                        detected=detected,
-                        confidence=confidence,
-                        count=0,
-                        matches=[],
-                        notes=notes
-                    )
-            else:
-                # Phase 1.2: Text-based detection (limited)
-                north_count = full_text.upper().count('NORTH')
-
-                if north_count > 50:
-                    detected = False
-                    confidence = 0.0
-                    notes = "Text-only detection unreliable for graphic symbols."
-                elif 1 <= north_count <= 10:
-                    detected = True
-                    confidence = 0.3
-                    notes = "Possible north arrow detected via text. Enable visual detection for better accuracy."
-                else:
-                    detected = False
-                    confidence = 0.0
-                    notes = "No north arrow detected via text. Enable visual detection."
-
-                results[element] = DetectionResult(
-                    element=element,
-                    detected=detected,
-                    confidence=confidence,
-                    count=north_count if north_count <= 10 else 0,
-                    matches=[],
-                    notes=notes
-                )
+        # Log result
+        logger.info(
+            "%s %s: detected=%s, count=%d, confidence=%.2f",
+            "✓" if result.detected else "✗", element,
+            result.detected, result.count, result.confidence
+        )
 
-            # Log result
-            status = "✓" if results[element].detected else "✗"
-            logger.info(f"{status} {element}: detected={results[element].detected}, confidence={results[element].confidence:.2f}")
-            continue  # Skip normal keyword detection
+    logger.info("Label detection complete")
+    return results
 
-        # Special handling for numeric labels (contours, lot/block)
-        if element in ["existing_contours", "proposed_contours", "lot_block"]:
-            detected, count = detect_numeric_labels(full_text, keywords)
-            confidence = 0.7 if detected else 0.0  # Lower confidence for numeric detection
-            matches = [f"Found {count} numeric labels"] if detected else []
-            notes = "Numeric label detection requires manual verification"
 
-        else:
-            # Standard keyword detection
-            detected, matches = detect_keyword(full_text, keywords, fuzzy=True, threshold=0.8)
-            count = count_keyword_occurrences(full_text, keywords, fuzzy=True, threshold=0.85)
-            confidence = 0.9 if detected else 0.0
-
-            # Adjust confidence based on number of matches
-            if detected and count > 1:
-                confidence = min(0.95, 0.9 + (count * 0.01))
-
-            notes = ""
-
-            # False positive filtering: excessive occurrences likely from notes/text
-            if count > 50:
-                # Suspiciously high - likely counting text mentions
-                confidence *= 0.3  # Reduce confidence drastically
-                detected = False   # Mark as not detected
-                notes = f"Excessive occurrences ({count}), likely false positive from notes/text"
-                logger.warning(f"{element}: {count} occurrences - likely false positive")
-
-        results[element] = DetectionResult(
-            element=element,
-            detected=detected,
-            confidence=confidence,
-            count=count,
-            matches=matches,
-            notes=notes
-        )
+def _init_detection_worker(ocr_engine: str) -> None:
+    """Process-pool initializer: single-threaded Tesseract and a warm OCR engine."""
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    try:
+        get_ocr_engine(ocr_engine)
+    except Exception as e:
+        logger.warning(f"OCR engine warm-up failed: {e}")
 
-        # Log result
-        status = "✓" if detected else "✗"
-        logger.info(f"{status} {element}: detected={detected}, count={count}, confidence={confidence:.2f}")
 
-    logger.info("Label detection complete")
-    return results
+def _detect_required_labels_worker(image: np.ndarray, options: Dict) -> Dict[str, DetectionResult]:
+    """Process-pool entry point (must be module-level to be picklable)."""
+    return detect_required_labels(image, **options)
+
+
+def detect_required_labels_batch(
+    images: List[np.ndarray],
+    checklist_elements: Optional[List[str]] = None,
+    enable_visual_detection: bool = True,
+    template_dir: Optional[Path] = None,
+    ocr_engine: str = "tesseract",
+    max_workers: Optional[int] = None
+) -> List[Dict[str, DetectionResult]]:
+    """
+    Run detect_required_labels() over several sheet images in parallel.
+
+    Each worker process keeps its own warm OCR engine for every image it
+    handles. Tesseract is single-threaded per image, so pages parallelize
+    across processes almost linearly.
+
+    Args:
+        images: Preprocessed sheet images (grayscale)
+        checklist_elements: Optional list of specific elements to check
+        enable_visual_detection: Enable Phase 1.3 visual detection (default: True)
+        template_dir: Directory containing symbol templates (default: auto-detect)
+        ocr_engine: OCR engine to use ("paddleocr" or "tesseract")
+        max_workers: Worker processes (default: half the CPU count; 1 = run inline)
+
+    Returns:
+        Detection results for each image, in input order
+    """
+    options = {
+        "checklist_elements": checklist_elements,
+        "enable_visual_detection": enable_visual_detection,
+        "template_dir": template_dir,
+        "ocr_engine": ocr_engine,
+    }
+
+    if max_workers is None:
+        max_workers = max((os.cpu_count() or 2) // 2, 1)
+
+    if max_workers <= 1 or len(images) <= 1:
+        return [detect_required_labels(image, **options) for image in images]
+
+    with ProcessPoolExecutor(
+        max_workers=min(max_workers, len(images)),
+        initializer=_init_detection_worker,
+        initargs=(ocr_engine,)
+    ) as executor:
+        return list(executor.map(
+            _detect_required_labels_worker, images, [options] * len(images)
+        ))
 
 
 def verify_minimum_quantities(results: Dict[str, DetectionResult]) -> Dict[str, bool]:
@@ -872,19 +1643,23 @@ def get_checklist_summary(results: Dict[str, DetectionResult]) -> Dict[str, any]
         >>> print(f"Passed: {summary['passed']}/{summary['total']}")
     """
     total = len(results)
-    passed = sum(1 for r in results.values() if r.detected)
-    failed = total - passed
+    passed = 0
+    confidence_sum = 0.0
 
-    # Calculate average confidence
-    confidences = [r.confidence for r in results.values() if r.detected]
-    avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+    # Single pass over the results for pass count and average confidence
+    for result in results.values():
+        if result.detected:
+            passed += 1
+            confidence_sum += result.confidence
 
-    # Identify critical failures
-    critical_failures = []
-    quantity_results = verify_minimum_quantities(results)
-    for element, passed in quantity_results.items():
-        if not passed:
-            critical_failures.append(element)
+    failed = total - passed
+    avg_confidence = confidence_sum / passed if passed else 0.0
+
+    # Identify critical failures (elements missing from the results count as failed)
+    critical_failures = [
+        element for element, ok in verify_minimum_quantities(results).items()
+        if not ok
+    ]
 
     summary = {
         "total": total,
@@ -895,6 +1670,6 @@ def get_checklist_summary(results: Dict[str, DetectionResult]) -> Dict[str, any]
         "critical_failures": critical_failures,
     }
 
-    logger.info(f"Summary: {passed}/{total} checks passed ({summary['pass_rate']:.1%})")
+    logger.info("Summary: %d/%d checks passed (%.1f%%)", passed, total, summary["pass_rate"] * 100)
 
     return summary
@@ -5,30 +5,182 @@ Integration module that orchestrates extraction, detection, and validation.
 Manages OCR cache lifecycle to eliminate redundant OCR processing.
 """
 
+import hashlib
+import json
 import logging
+import os
 import time
-from typing import Dict, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypedDict, Union
 from pathlib import Path
 import numpy as np
 
-from .extractor import extract_esc_sheet, save_image
+from . import __version__
+from .extractor import extract_esc_sheet, save_image, load_image
 from .text_detector import (
     detect_required_labels,
     verify_minimum_quantities,
     get_checklist_summary,
     DetectionResult,
-    extract_text_from_image
+    compute_image_key,
+    extract_ocr_results,
+    _init_detection_worker
 )
-from .symbol_detector import verify_contour_conventions
-from .quality_checker import QualityChecker, QualityCheckResults
-from .ocr_engine import clear_ocr_cache  # Phase 4.1: Cache lifecycle management
+from .ocr_engine import OCRResult, clear_ocr_cache, get_ocr_engine  # Phase 4.1: Cache lifecycle management
+
+if TYPE_CHECKING:
+    from .quality_checker import QualityChecker
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
-def validate_sheet_type(detection_results: Dict[str, DetectionResult]) -> Dict[str, any]:
+class ValidationResult(TypedDict, total=False):
+    """Result of validate_esc_sheet(); optional steps add their own keys."""
+    success: bool
+    page_num: Optional[int]
+    detection_results: Dict[str, DetectionResult]
+    quantity_results: Dict[str, bool]
+    summary: Dict[str, Any]
+    sheet_validation: Dict[str, Any]
+    line_verification: Dict[str, Any]
+    quality_checks: Dict[str, Any]
+    skipped_steps: List[str]
+    errors: List[str]
+
+
+# Optional persistent cache of extracted sheet images, keyed by PDF content
+# and extraction settings. PDF rasterization and OCR preprocessing dominate
+# a validation run, so re-validating an unchanged PDF (CI, re-checks) skips
+# both. Off unless a directory is configured; the environment variable also
+# reaches worker processes.
+EXTRACTION_CACHE_ENV = "ESC_VALIDATOR_EXTRACTION_CACHE_DIR"
+_EXTRACTION_CACHE_VERSION = 1
+_extraction_cache_dir: Optional[Path] = (
+    Path(os.environ[EXTRACTION_CACHE_ENV]) if os.environ.get(EXTRACTION_CACHE_ENV) else None
+)
+
+
+def set_extraction_cache_dir(cache_dir: Optional[Union[str, Path]]) -> None:
+    """
+    Enable the on-disk extraction cache in cache_dir, or disable it with None.
+
+    Worker processes started afterwards only see the setting through the
+    ESC_VALIDATOR_EXTRACTION_CACHE_DIR environment variable.
+    """
+    global _extraction_cache_dir
+    _extraction_cache_dir = Path(cache_dir) if cache_dir else None
+
+
+def _file_digest(path: Path, chunk_size: int = 1 << 20) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    sha = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+def _write_json_atomic(path: Path, data: Any, **dump_kwargs: Any) -> None:
+    """
+    Write data to path as JSON via a temporary file, so readers never see a
+    partial file. The temporary file is removed if writing fails.
+    """
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, **dump_kwargs)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+
+def _extract_esc_sheet_cached(
+    pdf_path: Path,
+    sheet_keyword: str,
+    page_num: Optional[int],
+    dpi: int,
+    load_original: bool = True
+) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], Optional[int]]:
+    """
+    extract_esc_sheet() with preprocessing, served from the extraction cache when enabled.
+
+    Images are stored as lossless PNGs next to a JSON sidecar holding the
+    page number; the sidecar is written last and marks a complete entry.
+    The full-color sheet is only written when load_original is set; with
+    load_original=False a cache hit skips decoding it and returns None in
+    its place, and an entry without it counts as a miss when it is needed.
+    """
+    cache_dir = _extraction_cache_dir
+    if cache_dir is None:
+        return extract_esc_sheet(
+            pdf_path=str(pdf_path), sheet_keyword=sheet_keyword,
+            page_num=page_num, dpi=dpi, preprocess=True
+        )
+
+    key_source = f"{_EXTRACTION_CACHE_VERSION}|{_file_digest(pdf_path)}|{sheet_keyword}|{page_num}|{dpi}"
+    key = hashlib.sha256(key_source.encode()).hexdigest()
+    meta_path = cache_dir / f"{key}.json"
+    original_path = cache_dir / f"{key}_original.png"
+    preprocessed_path = cache_dir / f"{key}_preprocessed.png"
+
+    try:
+        with open(meta_path, "r", encoding="utf-8") as f:
+            page_num_found = json.load(f)["page_num"]
+        original_image = load_image(str(original_path)) if load_original else None
+        preprocessed_image = load_image(str(preprocessed_path), grayscale=True)
+        if (original_image is not None or not load_original) and preprocessed_image is not None:
+            logger.info("Using cached extraction for %s (page %d)", pdf_path.name, page_num_found + 1)
+            return original_image, preprocessed_image, page_num_found
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    original_image, preprocessed_image, page_num_found = extract_esc_sheet(
+        pdf_path=str(pdf_path), sheet_keyword=sheet_keyword,
+        page_num=page_num, dpi=dpi, preprocess=True
+    )
+
+    if original_image is not None and preprocessed_image is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            saved = save_image(preprocessed_image, str(preprocessed_path))
+            if saved and load_original:
+                saved = save_image(original_image, str(original_path))
+            if saved:
+                _write_json_atomic(meta_path, {"page_num": page_num_found})
+        except OSError as e:
+            logger.warning(f"Could not write extraction cache for {pdf_path.name}: {e}")
+
+    return original_image, preprocessed_image, page_num_found
+
+
+def _error_result(error: str) -> ValidationResult:
+    """Log error and build the result returned when validation can't proceed."""
+    logger.error(error)
+    return {
+        "success": False,
+        "page_num": None,
+        "detection_results": {},
+        "quantity_results": {},
+        "summary": {},
+        "errors": [error]
+    }
+
+
+# Sheet-type scoring: weight of each detected ESC feature, the features at
+# least one of which must be present, and the per-element count above which
+# a sheet looks like a cover sheet or index rather than an ESC plan.
+_ESC_FEATURE_WEIGHTS = {"silt_fence": 3, "sce": 3, "conc_wash": 3, "loc": 2}
+_CRITICAL_ESC_FEATURES = frozenset(("silt_fence", "sce", "conc_wash"))
+_EXCESSIVE_COUNT = 50
+
+
+def validate_sheet_type(detection_results: Dict[str, DetectionResult]) -> Dict[str, Any]:
     """
     Validate that analyzed sheet is likely an ESC plan (not cover sheet, etc.)
 
@@ -45,31 +197,22 @@ def validate_sheet_type(detection_results: Dict[str, DetectionResult]) -> Dict[s
             - warnings: List[str] - Validation warnings
     """
     warnings = []
+
     score = 0
+    has_esc_features = False
 
-    # Check for ESC-specific features
-    if detection_results.get("silt_fence", DetectionResult("", False, 0.0, 0, [])).detected:
-        score += 3
-    if detection_results.get("sce", DetectionResult("", False, 0.0, 0, [])).detected:
-        score += 3
-    if detection_results.get("conc_wash", DetectionResult("", False, 0.0, 0, [])).detected:
-        score += 3
-    if detection_results.get("loc", DetectionResult("", False, 0.0, 0, [])).detected:
-        score += 2
-
-    # Check for suspicious patterns (cover sheet indicators)
     for element, result in detection_results.items():
-        if result.count > 50:
+        # Check for ESC-specific features
+        if result.detected:
+            score += _ESC_FEATURE_WEIGHTS.get(element, 0)
+            has_esc_features = has_esc_features or element in _CRITICAL_ESC_FEATURES
+
+        # Check for suspicious patterns (cover sheet indicators)
+        if result.count > _EXCESSIVE_COUNT:
             warnings.append(f"Excessive {element} occurrences ({result.count}) - may not be ESC plan")
             score -= 2
 
     # Missing critical ESC features
-    has_esc_features = (
-        detection_results.get("silt_fence", DetectionResult("", False, 0.0, 0, [])).detected or
-        detection_results.get("sce", DetectionResult("", False, 0.0, 0, [])).detected or
-        detection_results.get("conc_wash", DetectionResult("", False, 0.0, 0, [])).detected
-    )
-
     if not has_esc_features:
         warnings.append("No ESC-specific features detected - may be wrong sheet type")
         score -= 5
@@ -84,6 +227,139 @@ def validate_sheet_type(detection_results: Dict[str, DetectionResult]) -> Dict[s
     }
 
 
+def _run_line_verification(
+    preprocessed_image: np.ndarray,
+    text: str
+) -> Tuple[Optional[Dict], List[str], float]:
+    """
+    Step 5 of validate_esc_sheet(): contour line type verification.
+
+    Args:
+        preprocessed_image: Preprocessed sheet image
+        text: OCR text of the sheet
+
+    Returns:
+        Tuple of (line verification dict or None on failure, errors, seconds taken)
+    """
+    step_start = time.perf_counter()
+    errors = []
+    line_verification = None
+    try:
+        # Use Phase 2.1 smart filtering by default
+        from .symbol_detector import verify_contour_conventions_smart
+        line_verification = verify_contour_conventions_smart(
+            preprocessed_image,
+            text,
+            max_distance=150,  # Default proximity threshold
+            use_spatial_filtering=True
+        )
+
+        # Add warnings if line conventions are violated
+        if not line_verification.get('existing_correct', True):
+            errors.append("WARNING: Existing contour line type may be incorrect")
+        if not line_verification.get('proposed_correct', True):
+            errors.append("WARNING: Proposed contour line type may be incorrect")
+
+    except Exception as e:
+        logger.warning(f"Line verification failed: {e}")
+        errors.append(f"Line verification error: {e}")
+
+    return line_verification, errors, time.perf_counter() - step_start
+
+
+@lru_cache(maxsize=4)
+def _get_quality_checker(min_text_confidence: float, min_overlap_severity: str) -> "QualityChecker":
+    """Shared QualityChecker per settings; check_quality() keeps no state between calls."""
+    from .quality_checker import QualityChecker
+    return QualityChecker(
+        min_text_confidence=min_text_confidence,
+        min_overlap_severity=min_overlap_severity
+    )
+
+
+def _run_quality_checks(
+    preprocessed_image: np.ndarray,
+    ocr_results: Optional[List[OCRResult]] = None,
+    include_issue_details: bool = True
+) -> Tuple[Optional[Dict], List[str], float]:
+    """
+    Step 6 of validate_esc_sheet(): label overlap and proximity checks.
+
+    With include_issue_details=False only the counts are reported; the
+    per-issue lists are left empty and marked "truncated".
+
+    Args:
+        preprocessed_image: Preprocessed sheet image
+        ocr_results: OCR results for the sheet (default: None, use the shared OCR cache)
+        include_issue_details: List each issue, not just the counts (default: True)
+
+    Returns:
+        Tuple of (JSON-ready quality check dict or None on failure, errors, seconds taken)
+    """
+    step_start = time.perf_counter()
+    errors = []
+    quality_check_results = None
+    try:
+        quality_checker = _get_quality_checker(40.0, "minor")
+
+        # Run quality checks (Phase 4.1: will use cached OCR from Step 2)
+        qc_results = quality_checker.check_quality(
+            image=preprocessed_image,
+            features=None,  # TODO: Extract features for proximity validation
+            ocr_results=ocr_results
+        )
+
+        # Convert to dict for JSON serialization
+        quality_check_results = {
+            "total_issues": qc_results.total_issues,
+            "overlapping_labels": {
+                "total": len(qc_results.overlapping_labels),
+                "critical": qc_results.critical_overlaps,
+                "warning": qc_results.warning_overlaps,
+                "issues": [
+                    {
+                        "text1": issue.text1,
+                        "text2": issue.text2,
+                        "overlap_percent": round(issue.overlap_percent, 1),
+                        "severity": issue.severity,
+                        "location": issue.location
+                    }
+                    for issue in qc_results.overlapping_labels
+                ] if include_issue_details else []
+            },
+            "proximity_validation": {
+                "total": len(qc_results.proximity_issues),
+                "errors": qc_results.proximity_errors,
+                "warnings": qc_results.proximity_warnings,
+                "issues": [
+                    {
+                        "label_text": issue.label_text,
+                        "label_type": issue.label_type,
+                        "nearest_distance": issue.nearest_distance,
+                        "expected_max": issue.expected_max,
+                        "severity": issue.severity
+                    }
+                    for issue in qc_results.proximity_issues
+                ] if include_issue_details else []
+            }
+        }
+        if not include_issue_details:
+            quality_check_results["overlapping_labels"]["truncated"] = True
+            quality_check_results["proximity_validation"]["truncated"] = True
+
+        # Add warnings for critical quality issues
+        if qc_results.critical_overlaps > 0:
+            errors.append(f"WARNING: {qc_results.critical_overlaps} critical overlapping labels found")
+        if qc_results.proximity_errors > 0:
+            errors.append(f"WARNING: {qc_results.proximity_errors} spatial placement errors found")
+
+    except Exception as e:
+        logger.warning(f"Quality checks failed: {e}")
+        errors.append(f"Quality checks error: {e}")
+
+    return quality_check_results, errors, time.perf_counter() - step_start
+
+
 def validate_esc_sheet(
     pdf_path: str,
     sheet_keyword: str = "ESC",
@@ -94,8 +370,12 @@ def validate_esc_sheet(
     enable_line_detection: bool = False,
     enable_quality_checks: bool = False,
     ocr_engine: str = "paddleocr",
-    verbose: bool = False
-) -> Dict[str, any]:
+    verbose: bool = False,
+    max_ocr_px: Optional[int] = None,
+    use_extraction_cache: bool = True,
+    force_full_validation: bool = False,
+    include_issue_details: bool = True
+) -> ValidationResult:
     """
     Complete ESC sheet validation workflow (Phase 1-4 + Phase 4.1).
 
@@ -116,6 +396,18 @@ def validate_esc_sheet(
         enable_quality_checks: Enable Phase 4 quality checks (default: False)
         ocr_engine: OCR engine to use ("paddleocr" or "tesseract", default: "paddleocr")
         verbose: Show detailed progress and timing information (default: False)
+        max_ocr_px: Downscale the sheet so its long edge is at most this many
+                    pixels before OCR, e.g. 3000 for large sheets at 300 DPI
+                    (default: None, OCR at full resolution)
+        use_extraction_cache: Reuse extracted sheet images from the on-disk
+                              extraction cache, if one is configured with
+                              set_extraction_cache_dir() (default: True)
+        force_full_validation: Run line detection and quality checks even when
+                               the sheet doesn't look like an ESC plan (default:
+                               False, those steps are skipped)
+        include_issue_details: List every overlap and proximity issue in the
+                               quality check results; False reports counts only
+                               (default: True)
 
     Returns:
         Dictionary containing:
@@ -126,6 +418,8 @@ def validate_esc_sheet(
         - summary: Dict - Summary statistics
         - line_verification: Dict - Contour line verification (if enable_line_detection=True)
         - quality_checks: Dict - Quality check results (if enable_quality_checks=True)
+        - skipped_steps: List[str] - Optional steps skipped because the sheet
+          isn't an ESC plan ("line_detection", "quality_checks"), if any
         - errors: List[str] - Any errors encountered
 
     Example:
@@ -137,10 +431,10 @@ def validate_esc_sheet(
         ...     if results.get("quality_checks"):
         ...         print(f"Quality issues: {results['quality_checks']['total_issues']}")
     """
-    logger.info(f"Starting ESC sheet validation for: {pdf_path} (OCR engine: {ocr_engine})")
+    logger.info("Starting ESC sheet validation for: %s (OCR engine: %s)", pdf_path, ocr_engine)
 
     errors = []
-    start_time = time.time()
+    start_time = time.perf_counter()
 
     # Calculate total steps
     total_steps = 4  # Base steps: find sheet, extract, detect labels, verify quantities
@@ -149,211 +443,186 @@ def validate_esc_sheet(
     if enable_quality_checks:
         total_steps += 1
 
-    # Clear OCR cache at start to prevent memory leaks (Phase 4.1)
-    clear_ocr_cache()
-
     # Validate inputs
-    if not Path(pdf_path).exists():
-        error = f"PDF file not found: {pdf_path}"
-        logger.error(error)
-        return {
-            "success": False,
-            "page_num": None,
-            "detection_results": {},
-            "quantity_results": {},
-            "summary": {},
-            "errors": [error]
-        }
+    pdf_file = Path(pdf_path)
+    if not pdf_file.is_file():
+        return _error_result(f"PDF file not found: {pdf_path}")
+
+    # Creating the OCR engine (PaddleOCR loads its models) doesn't need the
+    # sheet, so it overlaps PDF rendering; the engine is reused once created.
+    # The warm-up is joined on every exit below so it never outlives the call.
+    warmup = ThreadPoolExecutor(max_workers=1)
+    engine_ready = warmup.submit(get_ocr_engine, ocr_engine)
 
     # Wrap in try/finally to ensure OCR cache is cleared (Phase 4.1)
     try:
+        # Drop OCR results left by other callers (validate_esc_sheet_from_image,
+        # direct detect_required_labels calls), so a failed Step 2 OCR can't
+        # make Step 5 check labels from another sheet
+        clear_ocr_cache()
+
         # Step 1: Extract ESC sheet
         current_step = 1
         if verbose:
             print(f"[{current_step}/{total_steps}] Searching for ESC sheet...")
-        step_start = time.time()
-        original_image, preprocessed_image, page_num_found = extract_esc_sheet(
-            pdf_path=pdf_path,
-            sheet_keyword=sheet_keyword,
-            page_num=page_num,
-            dpi=dpi,
-            preprocess=True
-        )
-
-        if original_image is None or preprocessed_image is None:
-            error = "Failed to extract ESC sheet from PDF"
-            logger.error(error)
-            return {
-                "success": False,
-                "page_num": None,
-                "detection_results": {},
-                "quantity_results": {},
-                "summary": {},
-                "errors": [error]
-            }
+        step_start = time.perf_counter()
+        if use_extraction_cache:
+            original_image, preprocessed_image, page_num_found = _extract_esc_sheet_cached(
+                pdf_file, sheet_keyword, page_num, dpi, load_original=save_images
+            )
+        else:
+            original_image, preprocessed_image, page_num_found = extract_esc_sheet(
+                pdf_path=pdf_path,
+                sheet_keyword=sheet_keyword,
+                page_num=page_num,
+                dpi=dpi,
+                preprocess=True
+            )
+
+        if preprocessed_image is None or (save_images and original_image is None):
+            return _error_result("Failed to extract ESC sheet from PDF")
 
         if verbose:
-            print(f"      ✓ Found ESC sheet: page {page_num_found + 1} ({time.time() - step_start:.1f}s)")
+            print(f"      ✓ Found ESC sheet: page {page_num_found + 1} ({time.perf_counter() - step_start:.1f}s)")
 
-        logger.info(f"Successfully extracted ESC sheet from page {page_num_found + 1}")
+        logger.info("Successfully extracted ESC sheet from page %d", page_num_found + 1)
 
         # Optional: Save images for inspection
         if save_images:
             if output_dir is None:
-                output_dir = Path(pdf_path).parent / "esc_validation_output"
+                output_dir = pdf_file.parent / "esc_validation_output"
 
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
 
-            pdf_name = Path(pdf_path).stem
+            pdf_name = pdf_file.stem
             original_path = output_path / f"{pdf_name}_page{page_num_found + 1}_original.png"
             preprocessed_path = output_path / f"{pdf_name}_page{page_num_found + 1}_preprocessed.png"
 
             save_image(original_image, str(original_path))
             save_image(preprocessed_image, str(preprocessed_path))
-            logger.info(f"Saved images to: {output_path}")
+            logger.info("Saved images to: %s", output_path)
+
+        # Only the preprocessed sheet is used from here on; at 300 DPI the
+        # full-color original is a few hundred MB, so don't hold it through OCR
+        del original_image
 
         # Step 2: Detect required labels (Phase 4.1: OCR runs here and populates cache)
         current_step += 1
         if verbose:
             print(f"[{current_step}/{total_steps}] Running text detection...")
-        step_start = time.time()
+        step_start = time.perf_counter()
+        # A failed engine setup is reported again, and handled, by detection
+        engine_ready.exception()
         # Phase 4.1 + 5: Pass ocr_engine parameter through
-        detection_results = detect_required_labels(preprocessed_image, ocr_engine=ocr_engine)
+        # Every OCR lookup below is keyed on the sheet's pixels; hash them once
+        image_key = compute_image_key(preprocessed_image)
+        detection_results = detect_required_labels(
+            preprocessed_image, ocr_engine=ocr_engine, max_ocr_px=max_ocr_px,
+            image_key=image_key
+        )
 
         if verbose:
             detected_count = sum(1 for r in detection_results.values() if r.detected)
             total_count = len(detection_results)
-            print(f"      ✓ {detected_count}/{total_count} elements detected ({time.time() - step_start:.1f}s)")
+            print(f"      ✓ {detected_count}/{total_count} elements detected ({time.perf_counter() - step_start:.1f}s)")
 
         # Step 3: Verify minimum quantities
         current_step += 1
         if verbose:
             print(f"[{current_step}/{total_steps}] Verifying minimum quantities...")
-        step_start = time.time()
+        step_start = time.perf_counter()
         quantity_results = verify_minimum_quantities(detection_results)
 
         if verbose:
             passed_count = sum(1 for v in quantity_results.values() if v)
             total_count = len(quantity_results)
-            print(f"      ✓ {passed_count}/{total_count} quantity checks passed ({time.time() - step_start:.1f}s)")
+            print(f"      ✓ {passed_count}/{total_count} quantity checks passed ({time.perf_counter() - step_start:.1f}s)")
 
         # Step 4: Validate sheet type
         current_step += 1
         if verbose:
             print(f"[{current_step}/{total_steps}] Validating sheet type...")
-        step_start = time.time()
+        step_start = time.perf_counter()
         sheet_validation = validate_sheet_type(detection_results)
 
         if verbose:
             confidence = sheet_validation['confidence'] * 100
-            print(f"      ✓ Sheet type validated ({confidence:.0f}% confidence, {time.time() - step_start:.1f}s)")
+            print(f"      ✓ Sheet type validated ({confidence:.0f}% confidence, {time.perf_counter() - step_start:.1f}s)")
 
         # Add sheet validation warnings to errors list
         if not sheet_validation["is_esc_sheet"]:
             errors.append("WARNING: This may not be an ESC plan sheet - see validation warnings")
 
-        # Step 5: Line type detection (Phase 2 + 2.1 - optional)
-        line_verification = None
+        # Steps 5 and 6 are by far the slowest and mean nothing on a sheet
+        # that isn't an ESC plan (cover sheet, wrong page), so skip them there.
+        skipped_steps = []
+        if not sheet_validation["is_esc_sheet"] and not force_full_validation:
+            if enable_line_detection:
+                skipped_steps.append("line_detection")
+            if enable_quality_checks:
+                skipped_steps.append("quality_checks")
+            enable_line_detection = enable_quality_checks = False
+            if skipped_steps:
+                logger.warning(
+                    "Sheet does not look like an ESC plan - skipping %s "
+                    "(pass force_full_validation=True to run them)", ", ".join(skipped_steps)
+                )
+                if verbose:
+                    print(f"      Skipping {', '.join(skipped_steps)} (not an ESC sheet)")
+
+        # Steps 5 and 6: Line type detection (Phase 2 + 2.1) and quality checks
+        # (Phase 4 + 4.1), both optional. They only read the preprocessed image
+        # and OpenCV/Tesseract release the GIL, so run them side by side.
         if enable_line_detection:
             current_step += 1
             if verbose:
                 print(f"[{current_step}/{total_steps}] Running contour analysis...")
-            step_start = time.time()
-            try:
-                # Extract text for line verification (will use cached OCR if available)
-                text = extract_text_from_image(preprocessed_image, ocr_engine=ocr_engine, use_cache=True)
-
-                # Use Phase 2.1 smart filtering by default
-                from .symbol_detector import verify_contour_conventions_smart
-                line_verification = verify_contour_conventions_smart(
-                    preprocessed_image,
-                    text,
-                    max_distance=150,  # Default proximity threshold
-                    use_spatial_filtering=True
-                )
-
-                if verbose:
-                    contour_count = len(line_verification.get("contour_lines", []))
-                    print(f"      ✓ {contour_count} contours validated ({time.time() - step_start:.1f}s)")
-
-                # Add warnings if line conventions are violated
-                if not line_verification.get('existing_correct', True):
-                    errors.append("WARNING: Existing contour line type may be incorrect")
-                if not line_verification.get('proposed_correct', True):
-                    errors.append("WARNING: Proposed contour line type may be incorrect")
-
-            except Exception as e:
-                logger.warning(f"Line verification failed: {e}")
-                errors.append(f"Line verification error: {e}")
-
-        # Step 6: Quality checks (Phase 4 + Phase 4.1 - optional)
-        quality_check_results = None
         if enable_quality_checks:
             current_step += 1
             if verbose:
                 print(f"[{current_step}/{total_steps}] Running quality checks...")
-            step_start = time.time()
-            try:
-                quality_checker = QualityChecker(
-                    min_text_confidence=40.0,
-                    min_overlap_severity="minor"
-                )
 
-                # Run quality checks (Phase 4.1: will use cached OCR from Step 2)
-                qc_results = quality_checker.check_quality(
-                    image=preprocessed_image,
-                    features=None  # TODO: Extract features for proximity validation
+        # Both steps work from the OCR results of Step 2 (an OCR cache hit)
+        ocr_results = None
+        if enable_line_detection or enable_quality_checks:
+            ocr_results = extract_ocr_results(
+                preprocessed_image, ocr_engine=ocr_engine, max_ocr_px=max_ocr_px,
+                image_key=image_key
+            )
+            text = "\n".join(result.text for result in ocr_results)
+
+        line_outcome = quality_outcome = None
+        if enable_line_detection and enable_quality_checks:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                line_future = executor.submit(_run_line_verification, preprocessed_image, text)
+                quality_future = executor.submit(
+                    _run_quality_checks, preprocessed_image, ocr_results, include_issue_details
                 )
+                line_outcome = line_future.result()
+                quality_outcome = quality_future.result()
+        elif enable_line_detection:
+            line_outcome = _run_line_verification(preprocessed_image, text)
+        elif enable_quality_checks:
+            quality_outcome = _run_quality_checks(
+                preprocessed_image, ocr_results, include_issue_details
+            )
 
-                # Convert to dict for JSON serialization
-                quality_check_results = {
-                    "total_issues": qc_results.total_issues,
-                    "overlapping_labels": {
-                        "total": len(qc_results.overlapping_labels),
-                        "critical": qc_results.critical_overlaps,
-                        "warning": qc_results.warning_overlaps,
-                        "issues": [
-                            {
-                                "text1": issue.text1,
-                                "text2": issue.text2,
-                                "overlap_percent": round(issue.overlap_percent, 1),
-                                "severity": issue.severity,
-                                "location": issue.location
-                            }
-                            for issue in qc_results.overlapping_labels
-                        ]
-                    },
-                    "proximity_validation": {
-                        "total": len(qc_results.proximity_issues),
-                        "errors": qc_results.proximity_errors,
-                        "warnings": qc_results.proximity_warnings,
-                        "issues": [
-                            {
-                                "label_text": issue.label_text,
-                                "label_type": issue.label_type,
-                                "nearest_distance": issue.nearest_distance,
-                                "expected_max": issue.expected_max,
-                                "severity": issue.severity
-                            }
-                            for issue in qc_results.proximity_issues
-                        ]
-                    }
-                }
-
-                if verbose:
-                    total_issues = qc_results.total_issues
-                    print(f"      ✓ Quality checks complete ({total_issues} issues found, {time.time() - step_start:.1f}s)")
-
-                # Add warnings for critical quality issues
-                if qc_results.critical_overlaps > 0:
-                    errors.append(f"WARNING: {qc_results.critical_overlaps} critical overlapping labels found")
-                if qc_results.proximity_errors > 0:
-                    errors.append(f"WARNING: {qc_results.proximity_errors} spatial placement errors found")
+        line_verification = None
+        if line_outcome is not None:
+            line_verification, step_errors, elapsed = line_outcome
+            errors.extend(step_errors)
+            if verbose and line_verification is not None:
+                contour_count = len(line_verification.get("contour_lines", []))
+                print(f"      ✓ {contour_count} contours validated ({elapsed:.1f}s)")
 
-            except Exception as e:
-                logger.warning(f"Quality checks failed: {e}")
-                errors.append(f"Quality checks error: {e}")
+        quality_check_results = None
+        if quality_outcome is not None:
+            quality_check_results, step_errors, elapsed = quality_outcome
+            errors.extend(step_errors)
+            if verbose and quality_check_results is not None:
+                total_issues = quality_check_results["total_issues"]
+                print(f"      ✓ Quality checks complete ({total_issues} issues found, {elapsed:.1f}s)")
 
         # Generate summary
         summary = get_checklist_summary(detection_results)
@@ -368,16 +637,16 @@ def validate_esc_sheet(
         success = True
 
         # Final summary message
-        total_time = time.time() - start_time
+        total_time = time.perf_counter() - start_time
         if verbose:
             print(f"\n✓ Validation complete in {total_time:.1f} seconds")
             print(f"  • {summary['passed']}/{summary['total']} checks passed")
             if quality_check_results:
                 print(f"  • {quality_check_results['total_issues']} quality issues found")
 
-        logger.info(f"Validation complete: {summary['passed']}/{summary['total']} checks passed")
+        logger.info("Validation complete: %d/%d checks passed", summary["passed"], summary["total"])
         if quality_check_results:
-            logger.info(f"Quality checks: {quality_check_results['total_issues']} issues found")
+            logger.info("Quality checks: %d issues found", quality_check_results["total_issues"])
 
         result = {
             "success": success,
@@ -397,15 +666,176 @@ def validate_esc_sheet(
         if quality_check_results is not None:
             result["quality_checks"] = quality_check_results
 
+        if skipped_steps:
+            result["skipped_steps"] = skipped_steps
+
         return result
 
     finally:
+        engine_ready.cancel()
+        warmup.shutdown(wait=True)
+
         # CRITICAL (Phase 4.1): Always clear OCR cache to prevent memory leaks
         clear_ocr_cache()
         logger.debug("OCR cache cleared")
 
 
-def validate_esc_sheet_from_image(image_path: str) -> Dict[str, any]:
+_BATCH_CHUNKS_PER_WORKER = 4
+_RESUME_VERSION = 2
+
+
+def _json_default(value: Any) -> Any:
+    """json.dump() fallback for the non-JSON types in a ValidationResult."""
+    if isinstance(value, DetectionResult):
+        return asdict(value)
+    if isinstance(value, (np.generic, np.ndarray)):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _validate_esc_sheet_worker(
+    pdf_path: str,
+    options: Dict,
+    resume_dir: Optional[str] = None
+) -> ValidationResult:
+    """
+    Process-pool entry point (must be module-level to be picklable).
+
+    An unexpected error fails only this PDF: it comes back as an error
+    result instead of aborting the rest of the batch.
+    """
+    try:
+        return _validate_esc_sheet_resumable(pdf_path, options, resume_dir)
+    except Exception as e:
+        return _error_result(f"Validation of {pdf_path} failed: {e}")
+
+
+def _validate_esc_sheet_resumable(
+    pdf_path: str,
+    options: Dict,
+    resume_dir: Optional[str] = None
+) -> ValidationResult:
+    """
+    Validate one PDF of a batch.
+
+    With resume_dir, each successful result is saved there as JSON as soon
+    as it is done, keyed by PDF content, options and package version, and
+    reused by later runs.
+    """
+    pdf_file = Path(pdf_path)
+    if resume_dir is None or not pdf_file.is_file():
+        return validate_esc_sheet(pdf_path, **options)
+
+    # Progress output doesn't change the result
+    key_options = sorted((k, v) for k, v in options.items() if k != "verbose")
+    key_source = f"{_RESUME_VERSION}|{__version__}|{_file_digest(pdf_file)}|{key_options!r}"
+    result_path = Path(resume_dir) / f"{hashlib.sha256(key_source.encode()).hexdigest()}.json"
+
+    try:
+        with open(result_path, "r", encoding="utf-8") as f:
+            result = json.load(f)
+        if "detection_results" in result:
+            result["detection_results"] = {
+                element: DetectionResult(**fields)
+                for element, fields in result["detection_results"].items()
+            }
+        logger.info("Reusing saved result for %s", pdf_file.name)
+        return result
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, TypeError, AttributeError) as e:  # Truncated or stale: validate again
+        logger.warning("Ignoring unreadable saved result for %s: %s", pdf_file.name, e)
+
+    result = validate_esc_sheet(pdf_path, **options)
+
+    if result["success"]:
+        try:
+            result_path.parent.mkdir(parents=True, exist_ok=True)
+            _write_json_atomic(result_path, result, default=_json_default)
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Could not save result for %s: %s", pdf_file.name, e)
+
+    return result
+
+
+def validate_esc_sheets(
+    pdf_paths: List[str],
+    sheet_keyword: str = "ESC",
+    dpi: int = 300,
+    save_images: bool = False,
+    output_dir: Optional[str] = None,
+    enable_line_detection: bool = False,
+    enable_quality_checks: bool = False,
+    ocr_engine: str = "paddleocr",
+    verbose: bool = False,
+    max_ocr_px: Optional[int] = None,
+    force_full_validation: bool = False,
+    max_workers: Optional[int] = None,
+    resume_dir: Optional[str] = None
+) -> List[ValidationResult]:
+    """
+    Validate several PDFs in parallel, one worker process per PDF.
+
+    Tesseract runs single-threaded in each worker (OMP_THREAD_LIMIT=1), which
+    scales much better across cores than Tesseract's own OpenMP threading.
+    Each worker keeps a warm OCR engine across the PDFs it handles.
+
+    Args:
+        pdf_paths: Paths to the PDF files
+        sheet_keyword: Keyword to identify ESC sheet (default: "ESC")
+        dpi: Resolution for extraction (default: 300)
+        save_images: Whether to save extracted/preprocessed images (default: False)
+        output_dir: Directory to save images (if save_images=True)
+        enable_line_detection: Enable Phase 2 line type detection (default: False)
+        enable_quality_checks: Enable Phase 4 quality checks (default: False)
+        ocr_engine: OCR engine to use ("paddleocr" or "tesseract", default: "paddleocr")
+        verbose: Print progress indicators for each PDF (default: False)
+        max_ocr_px: Long-edge pixel limit for OCR (default: None, full resolution)
+        force_full_validation: Run optional checks on non-ESC sheets too (default: False)
+        max_workers: Worker processes (default: half the CPU count; 1 = run inline)
+        resume_dir: Save each successful result in this directory and reuse
+                    saved results, so an interrupted batch picks up where it
+                    stopped (default: None)
+
+    Returns:
+        Validation results for each PDF (same format as validate_esc_sheet), in input order
+    """
+    options = {
+        "sheet_keyword": sheet_keyword,
+        "dpi": dpi,
+        "save_images": save_images,
+        "output_dir": output_dir,
+        "enable_line_detection": enable_line_detection,
+        "enable_quality_checks": enable_quality_checks,
+        "ocr_engine": ocr_engine,
+        "verbose": verbose,
+        "max_ocr_px": max_ocr_px,
+        "force_full_validation": force_full_validation,
+    }
+
+    if max_workers is None:
+        max_workers = max((os.cpu_count() or 2) // 2, 1)
+
+    if max_workers <= 1 or len(pdf_paths) <= 1:
+        return [_validate_esc_sheet_worker(pdf_path, options, resume_dir) for pdf_path in pdf_paths]
+
+    max_workers = min(max_workers, len(pdf_paths))
+    # Hand large batches out in chunks to cut per-task IPC; a few chunks per
+    # worker keeps the load balanced when sheet sizes vary.
+    chunksize = max(1, len(pdf_paths) // (max_workers * _BATCH_CHUNKS_PER_WORKER))
+
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_detection_worker,
+        initargs=(ocr_engine,)
+    ) as executor:
+        return list(executor.map(
+            _validate_esc_sheet_worker, pdf_paths, [options] * len(pdf_paths),
+            [resume_dir] * len(pdf_paths), chunksize=chunksize
+        ))
+
+
+def validate_esc_sheet_from_image(image_path: str) -> ValidationResult:
     """
     Validate ESC sheet from an already-extracted image file.
 
@@ -417,24 +847,13 @@ def validate_esc_sheet_from_image(image_path: str) -> Dict[str, any]:
     Returns:
         Validation results (same format as validate_esc_sheet)
     """
-    import cv2
-
-    logger.info(f"Validating ESC sheet from image: {image_path}")
+    logger.info("Validating ESC sheet from image: %s", image_path)
 
     # Load image
-    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    image = load_image(image_path, grayscale=True)
 
     if image is None:
-        error = f"Failed to load image: {image_path}"
-        logger.error(error)
-        return {
-            "success": False,
-            "page_num": None,
-            "detection_results": {},
-            "quantity_results": {},
-            "summary": {},
-            "errors": [error]
-        }
+        return _error_result(f"Failed to load image: {image_path}")
 
     # Run detection
     detection_results = detect_required_labels(image)
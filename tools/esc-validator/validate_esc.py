@@ -45,9 +45,15 @@ if sys.platform == "win32":
 # Add the esc_validator package to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from esc_validator import validate_esc_sheet
-from esc_validator.validator import validate_esc_sheet_from_image
+from esc_validator import validate_esc_sheet, validate_esc_sheets
+from esc_validator.validator import (
+    EXTRACTION_CACHE_ENV,
+    set_extraction_cache_dir,
+    validate_esc_sheet_from_image,
+)
+from esc_validator.ocr_engine import PADDLE_HPI_ENV, PADDLE_PRECISION_ENV
 from esc_validator.reporter import generate_markdown_report, generate_text_report, save_report
+from esc_validator.text_detector import OCR_DISK_CACHE_ENV, set_ocr_disk_cache_dir
 
 # Set up logging
 logging.basicConfig(
@@ -67,7 +73,8 @@ def validate_single_pdf(
     verbose_progress: bool = False,
     dpi: int = 300,
     enable_line_detection: bool = False,
-    ocr_engine: str = "tesseract"
+    ocr_engine: str = "tesseract",
+    force_full_validation: bool = False
 ) -> bool:
     """
     Validate a single PDF file.
@@ -82,6 +89,7 @@ def validate_single_pdf(
         verbose_progress: Show progress indicators during validation
         dpi: Resolution for extraction
         enable_line_detection: Enable Phase 2 line type detection
+        force_full_validation: Run optional checks even on non-ESC sheets
 
     Returns:
         True if validation passed, False otherwise
@@ -97,9 +105,31 @@ def validate_single_pdf(
         output_dir=output_dir,
         enable_line_detection=enable_line_detection,
         verbose=verbose_progress,
-        ocr_engine=ocr_engine
+        ocr_engine=ocr_engine,
+        force_full_validation=force_full_validation
     )
 
+    return report_results(results, pdf_path, output_path=output_path, verbose=verbose)
+
+
+def report_results(
+    results: dict,
+    pdf_path: str,
+    output_path: str = None,
+    verbose: bool = False
+) -> bool:
+    """
+    Print the summary for one validation result and save or print its report.
+
+    Args:
+        results: Result from validate_esc_sheet()
+        pdf_path: Path to the validated PDF file
+        output_path: Path to save report (optional, printed otherwise)
+        verbose: Include detailed findings in report
+
+    Returns:
+        True if validation passed, False otherwise
+    """
     # Check if validation succeeded
     if not results["success"]:
         print(f"\n❌ Validation FAILED for {Path(pdf_path).name}")
@@ -125,6 +155,10 @@ def validate_single_pdf(
         print(f"\n⚠️  {Path(pdf_path).name} - ACCEPTABLE")
         print(f"   Checks passed: {summary['passed']}/{summary['total']} ({summary['pass_rate']:.1%})")
 
+    skipped_steps = results.get("skipped_steps", [])
+    if skipped_steps:
+        print(f"   Skipped (not an ESC sheet): {', '.join(skipped_steps)} - use --force-full-validation to run")
+
     # Save report if output path specified
     if output_path:
         if save_report(report, output_path):
@@ -148,11 +182,17 @@ def validate_batch(
     verbose: bool = False,
     verbose_progress: bool = False,
     dpi: int = 300,
-    enable_line_detection: bool = False
+    enable_line_detection: bool = False,
+    ocr_engine: str = "tesseract",
+    max_workers: int = None,
+    force_full_validation: bool = False
 ) -> dict:
     """
     Validate multiple PDF files.
 
+    The PDFs are validated in parallel worker processes (see
+    validate_esc_sheets); reports are then written in input order.
+
     Args:
         pdf_paths: List of PDF file paths
         output_dir: Directory to save reports
@@ -161,6 +201,9 @@ def validate_batch(
         verbose_progress: Show progress indicators during validation
         dpi: Resolution for extraction
         enable_line_detection: Enable Phase 2 line type detection
+        ocr_engine: OCR engine to use
+        max_workers: Worker processes (default: half the CPU count; 1 = sequential)
+        force_full_validation: Run optional checks even on non-ESC sheets
 
     Returns:
         Dictionary with batch statistics
@@ -179,9 +222,30 @@ def validate_batch(
         "failed": 0,
     }
 
-    # Process each file
-    for pdf_path in pdf_paths:
+    # Errors in a single PDF come back as failed results for that PDF; only
+    # a broken worker pool (e.g. a worker killed for memory) raises here
+    try:
+        all_results = validate_esc_sheets(
+            pdf_paths,
+            dpi=dpi,
+            save_images=save_images,
+            output_dir=output_dir,
+            enable_line_detection=enable_line_detection,
+            ocr_engine=ocr_engine,
+            verbose=verbose_progress,
+            max_workers=max_workers,
+            force_full_validation=force_full_validation
+        )
+    except Exception as e:
+        logger.error(f"Batch validation failed: {e}")
+        all_results = [e] * len(pdf_paths)
+
+    # Report each file
+    for pdf_path, results in zip(pdf_paths, all_results):
         try:
+            if isinstance(results, Exception):
+                raise results
+
             # Generate output path
             if output_dir:
                 pdf_name = Path(pdf_path).stem
@@ -189,19 +253,16 @@ def validate_batch(
             else:
                 report_path = None
 
-            # Validate
-            passed = validate_single_pdf(
-                pdf_path=pdf_path,
+            passed = report_results(
+                results,
+                pdf_path,
                 output_path=str(report_path) if report_path else None,
-                save_images=save_images,
-                output_dir=output_dir,
-                verbose=verbose,
-                verbose_progress=verbose_progress,
-                dpi=dpi,
-                enable_line_detection=enable_line_detection
+                verbose=verbose
             )
 
-            if passed:
+            if not results["success"]:
+                results_summary["failed"] += 1
+            elif passed:
                 results_summary["passed"] += 1
             else:
                 results_summary["needs_review"] += 1
@@ -276,6 +337,12 @@ Examples:
         help="Batch process multiple PDFs"
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Worker processes for --batch (default: half the CPU count, 1 = sequential)"
+    )
+
     parser.add_argument(
         "-p", "--page",
         type=int,
@@ -325,6 +392,13 @@ Examples:
         help="Enable Phase 2 line type detection (contour verification)"
     )
 
+    parser.add_argument(
+        "--force-full-validation",
+        action="store_true",
+        help="Run line detection and quality checks even on sheets that don't look "
+             "like ESC sheets (by default they are skipped there)"
+    )
+
     parser.add_argument(
         "--ocr-engine",
         choices=["paddleocr", "tesseract"],
@@ -332,6 +406,28 @@ Examples:
         help="OCR engine to use (default: tesseract, paddleocr has API issues)"
     )
 
+    parser.add_argument(
+        "--ocr-cache-dir",
+        help="Cache OCR results on disk in this directory, keyed by image content"
+    )
+
+    parser.add_argument(
+        "--extraction-cache-dir",
+        help="Cache extracted sheet images on disk in this directory, keyed by PDF content"
+    )
+
+    parser.add_argument(
+        "--paddle-hpi",
+        action="store_true",
+        help="Use PaddleOCR high-performance inference (needs paddleocr[hpi])"
+    )
+
+    parser.add_argument(
+        "--paddle-precision",
+        choices=["fp32", "fp16"],
+        help="PaddleOCR inference precision with --paddle-hpi (default: fp32)"
+    )
+
     args = parser.parse_args()
 
     # Set log level based on verbosity flags
@@ -344,6 +440,19 @@ Examples:
     else:
         logging.getLogger().setLevel(logging.WARNING)
 
+    if args.ocr_cache_dir:
+        os.environ[OCR_DISK_CACHE_ENV] = args.ocr_cache_dir
+        set_ocr_disk_cache_dir(args.ocr_cache_dir)
+
+    if args.extraction_cache_dir:
+        os.environ[EXTRACTION_CACHE_ENV] = args.extraction_cache_dir
+        set_extraction_cache_dir(args.extraction_cache_dir)
+
+    if args.paddle_hpi:
+        os.environ[PADDLE_HPI_ENV] = "1"
+    if args.paddle_precision:
+        os.environ[PADDLE_PRECISION_ENV] = args.paddle_precision
+
     # Validate arguments
     if len(args.pdf_files) > 1 and not args.batch:
         print("Error: Multiple files specified without --batch flag")
@@ -364,7 +473,10 @@ Examples:
                 verbose=args.verbose_report,
                 verbose_progress=args.verbose,
                 dpi=args.dpi,
-                enable_line_detection=args.enable_line_detection
+                enable_line_detection=args.enable_line_detection,
+                ocr_engine=args.ocr_engine,
+                max_workers=args.workers,
+                force_full_validation=args.force_full_validation
             )
             # Exit with error code if any files failed or need review
             if results["failed"] > 0 or results["needs_review"] > 0:
@@ -382,7 +494,8 @@ Examples:
                 verbose_progress=args.verbose,
                 dpi=args.dpi,
                 enable_line_detection=args.enable_line_detection,
-                ocr_engine=args.ocr_engine
+                ocr_engine=args.ocr_engine,
+                force_full_validation=args.force_full_validation
             )
 
             # Exit with error code if validation failed